@@ -2,16 +2,21 @@
 FastAPI application factory and configuration.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
 import os
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from .routes import router
 from .frontend import frontend_router
-from utils import get_betting_odds_scheduler
+from utils import get_betting_odds_scheduler, close_webhook_session, flush_webhook_queue
+
+# Seconds shutdown waits for queued webhook deliveries
+WEBHOOK_FLUSH_TIMEOUT = 10.0
 
 
 def create_app() -> FastAPI:
@@ -47,6 +52,14 @@ def create_app() -> FastAPI:
     
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
     
+    # Prometheus scrape endpoint, on the exact path so scrapers get a 200
+    # rather than the redirect to "/metrics/" a mounted sub-app answers with
+    app.add_route(
+        "/metrics",
+        lambda request: Response(generate_latest(), media_type=CONTENT_TYPE_LATEST),
+        include_in_schema=False,
+    )
+    
     # Startup event to initialize betting odds scheduler
     @app.on_event("startup")
     async def startup_event():
@@ -63,6 +76,12 @@ def create_app() -> FastAPI:
         scheduler = get_betting_odds_scheduler()
         scheduler.stop()
         logging.info("Betting odds scheduler stopped")
+        
+        # Give queued webhooks a bounded chance to go out without blocking the loop
+        flushed = await asyncio.to_thread(flush_webhook_queue, WEBHOOK_FLUSH_TIMEOUT)
+        if not flushed:
+            logging.warning("Shutting down with undelivered webhook events")
+        close_webhook_session()
     
     return app
 
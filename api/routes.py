@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends, Body
 from fastapi.responses import HTMLResponse, JSONResponse
 import json
 
-from utils import DatabaseManager, get_logger, WebhookDelivery
+from utils import DatabaseManager, get_database_manager, get_logger, WebhookDelivery
 from collectors import COLLECTORS, get_collector
 from collectors.betting import BettingOddsCollector
 from .models import (
@@ -22,8 +22,8 @@ router = APIRouter()
 
 
 def get_db():
-    """Dependency to get database manager."""
-    return DatabaseManager()
+    """Dependency to get the shared database manager."""
+    return get_database_manager()
 
 
 @router.get("/health", response_model=HealthStatus)
@@ -390,14 +390,9 @@ async def collect_sport_data(sport: str, db: DatabaseManager = Depends(get_db)):
                 logger.warning(f"Failed to insert event: {e}")
                 continue
         
-        # Send webhooks if new events were added
+        # Send webhooks if new events were added, without waiting on the endpoints
         if newly_inserted_events:
-            try:
-                webhook_delivery = WebhookDelivery(db)
-                webhook_result = webhook_delivery.send_new_events(newly_inserted_events)
-                logger.info(f"Webhook delivery result: {webhook_result}")
-            except Exception as e:
-                logger.error(f"Failed to send webhooks: {e}")
+            WebhookDelivery(db).queue_new_events(newly_inserted_events)
         
         duration = (datetime.now() - start_time).total_seconds()
         
@@ -533,8 +528,9 @@ async def add_webhook(config: WebhookConfig, db: DatabaseManager = Depends(get_d
     try:
         webhook_id = db.add_webhook_config(config.name, config.url, config.enabled)
         
-        # Test the webhook
+        # Test the webhook, re-checking the URL rather than using a cached result
         webhook_delivery = WebhookDelivery(db)
+        webhook_delivery.clear_url_cache()
         is_reachable = webhook_delivery.test_webhook(config.url)
         
         return {
@@ -9,7 +9,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, date
 import json
 
-from utils import DatabaseManager, get_logger
+from utils import DatabaseManager, get_database_manager, get_logger
 from collectors import COLLECTORS, get_collector
 from collectors.betting import BettingOddsCollector
 
@@ -348,33 +348,33 @@ class HealthService:
 def get_events_service(db: Optional[DatabaseManager] = None) -> EventsService:
     """Get EventsService instance."""
     if db is None:
-        db = DatabaseManager()
+        db = get_database_manager()
     return EventsService(db)
 
 
 def get_collection_service(db: Optional[DatabaseManager] = None) -> CollectionService:
     """Get CollectionService instance."""
     if db is None:
-        db = DatabaseManager()
+        db = get_database_manager()
     return CollectionService(db)
 
 
 def get_betting_odds_service(db: Optional[DatabaseManager] = None) -> BettingOddsService:
     """Get BettingOddsService instance."""
     if db is None:
-        db = DatabaseManager()
+        db = get_database_manager()
     return BettingOddsService(db)
 
 
 def get_sports_service(db: Optional[DatabaseManager] = None) -> SportsService:
     """Get SportsService instance."""
     if db is None:
-        db = DatabaseManager()
+        db = get_database_manager()
     return SportsService(db)
 
 
 def get_health_service(db: Optional[DatabaseManager] = None) -> HealthService:
     """Get HealthService instance."""
     if db is None:
-        db = DatabaseManager()
+        db = get_database_manager()
     return HealthService(db)
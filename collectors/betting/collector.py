@@ -12,17 +12,74 @@ The Odds API is free for non-commercial use and provides:
 """
 
 import os
+import orjson
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any, Optional
 import time
 import random
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from utils.base_collector import BaseDataCollector
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Exponential retry delays in seconds for connection errors (1, 2, 4, ... capped at 30)
+_BACKOFF_DELAYS = tuple(min(30.0, float(1 << n)) for n in range(8))
+
+# Waits after a 429 without Retry-After: 5s, 10s, 15s...
+_RATE_LIMIT_BASE_DELAY = 5.0
+# Upper bound on a server-provided Retry-After
+_MAX_RETRY_AFTER = 120.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Get the retry delay for an attempt, with jitter.
+    
+    Jitter keeps concurrent sport fetches that were rate limited together
+    from all retrying at the same instant.
+    
+    Args:
+        attempt: Zero-based attempt number
+    
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return _BACKOFF_DELAYS[min(attempt, len(_BACKOFF_DELAYS) - 1)] + random.random() * 0.25
+
+
+def _rate_limit_delay(response: requests.Response, attempt: int) -> float:
+    """
+    Get how long to wait after a 429 response.
+    
+    Args:
+        response: The rate-limited response
+        attempt: Zero-based attempt number
+    
+    Returns:
+        The server's Retry-After (in seconds or as an HTTP date), or a linear
+        backoff from _RATE_LIMIT_BASE_DELAY when it is missing or unusable
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+    
+    return _RATE_LIMIT_BASE_DELAY * (attempt + 1) + random.random() * 0.25
+
 
 class BettingOddsCollector(BaseDataCollector):
     """
@@ -51,11 +108,12 @@ class BettingOddsCollector(BaseDataCollector):
         
         # IP rotation configuration (for sites that require scraping)
         self.proxy_list = self._load_proxy_list()
-        self.current_proxy_index = 0
+        self._proxy_cycle = itertools.cycle(self.proxy_list) if self.proxy_list else None
         
         # Rate limiting
-        self.last_request_time = 0
         self.min_request_interval = 2  # seconds between requests
+        self._next_request_ns = 0  # monotonic time the next request may start
+        self._rate_lock = threading.Lock()
     
     def _load_proxy_list(self) -> List[str]:
         """
@@ -81,11 +139,10 @@ class BettingOddsCollector(BaseDataCollector):
         Returns:
             Proxy configuration dict or None
         """
-        if not self.proxy_list:
+        if self._proxy_cycle is None:
             return None
         
-        proxy_url = self.proxy_list[self.current_proxy_index]
-        self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxy_list)
+        proxy_url = next(self._proxy_cycle)
         
         return {
             'http': proxy_url,
@@ -94,16 +151,17 @@ class BettingOddsCollector(BaseDataCollector):
     
     def _rate_limit(self):
         """Implement rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
+        # Each caller reserves the next free slot under the lock and sleeps
+        # outside it; the monotonic clock cannot jump with NTP adjustments
+        with self._rate_lock:
+            now = time.monotonic_ns()
+            start_at = max(now, self._next_request_ns)
+            self._next_request_ns = start_at + int(self.min_request_interval * 1e9)
+        
+        delay = (start_at - now) / 1e9
+        if delay > 0:
             # Add small random jitter to avoid patterns
-            sleep_time += random.uniform(0, 0.5)
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+            time.sleep(delay + random.uniform(0, 0.5))
     
     def _make_request(self, url: str, params: Dict[str, Any] = None, 
                      use_proxy: bool = False) -> Optional[requests.Response]:
@@ -118,8 +176,6 @@ class BettingOddsCollector(BaseDataCollector):
         Returns:
             Response object or None on failure
         """
-        self._rate_limit()
-        
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
@@ -130,8 +186,13 @@ class BettingOddsCollector(BaseDataCollector):
         
         max_retries = 3
         for attempt in range(max_retries):
+            # Retries go through the shared pacing too, so concurrent sport
+            # fetches don't burst right after being rate limited
+            self._rate_limit()
             try:
-                response = requests.get(
+                # The collector's session keeps its pooled connection to the
+                # Odds API alive between scheduler ticks
+                response = self.session.get(
                     url,
                     params=params,
                     headers=headers,
@@ -142,9 +203,10 @@ class BettingOddsCollector(BaseDataCollector):
                 if response.status_code == 200:
                     return response
                 elif response.status_code == 429:  # Rate limited
-                    wait_time = (attempt + 1) * 5
-                    logger.warning(f"Rate limited, waiting {wait_time}s before retry")
-                    time.sleep(wait_time)
+                    if attempt < max_retries - 1:
+                        wait_time = _rate_limit_delay(response, attempt)
+                        logger.warning(f"Rate limited, waiting {wait_time:.2f}s before retry")
+                        time.sleep(wait_time)
                     continue
                 else:
                     logger.warning(f"Request failed with status {response.status_code}")
@@ -157,7 +219,7 @@ class BettingOddsCollector(BaseDataCollector):
             except requests.exceptions.RequestException as e:
                 logger.error(f"Request error (attempt {attempt + 1}): {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    time.sleep(_backoff_delay(attempt))
                     if use_proxy:
                         proxies = self._get_next_proxy()
                     continue
@@ -177,42 +239,62 @@ class BettingOddsCollector(BaseDataCollector):
             logger.info("To enable: Get free API key from https://the-odds-api.com/")
             return None
         
-        all_odds = {}
+        # Sports are fetched in parallel; _rate_limit still spaces out the
+        # request starts, but responses no longer wait on each other
+        with ThreadPoolExecutor(max_workers=len(self.sport_mapping)) as executor:
+            futures = {
+                sport_name: executor.submit(self._fetch_sport_odds, sport_name, api_sport_key)
+                for sport_name, api_sport_key in self.sport_mapping.items()
+            }
+            results = {sport_name: future.result() for sport_name, future in futures.items()}
         
-        for sport_name, api_sport_key in self.sport_mapping.items():
-            try:
-                logger.info(f"Fetching odds for {sport_name} ({api_sport_key})")
-                
-                # Get upcoming events with odds
-                url = f"{self.base_url}/sports/{api_sport_key}/odds"
-                params = {
-                    'apiKey': self.api_key,
-                    'regions': 'us,uk',  # US and UK bookmakers
-                    'markets': 'h2h,spreads,totals',  # Head-to-head, spreads, totals
-                    'oddsFormat': 'decimal',
-                    'dateFormat': 'iso'
-                }
-                
-                response = self._make_request(url, params=params)
-                
-                if response and response.status_code == 200:
-                    odds_data = response.json()
-                    all_odds[sport_name] = odds_data
-                    logger.info(f"Retrieved odds for {len(odds_data)} {sport_name} events")
-                    
-                    # Check remaining quota
-                    remaining = response.headers.get('x-requests-remaining')
-                    if remaining:
-                        logger.info(f"API requests remaining: {remaining}")
-                else:
-                    logger.warning(f"Failed to fetch odds for {sport_name}")
-                
-            except Exception as e:
-                logger.error(f"Error fetching odds for {sport_name}: {e}")
-                continue
+        all_odds = {sport_name: odds for sport_name, odds in results.items() if odds is not None}
         
         return all_odds if all_odds else None
     
+    def _fetch_sport_odds(self, sport_name: str, api_sport_key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch betting odds for a single sport.
+        
+        Args:
+            sport_name: Internal sport name
+            api_sport_key: The Odds API sport key
+        
+        Returns:
+            List of raw odds events, or None on failure
+        """
+        try:
+            logger.info(f"Fetching odds for {sport_name} ({api_sport_key})")
+            
+            # Get upcoming events with odds
+            url = f"{self.base_url}/sports/{api_sport_key}/odds"
+            params = {
+                'apiKey': self.api_key,
+                'regions': 'us,uk',  # US and UK bookmakers
+                'markets': 'h2h,spreads,totals',  # Head-to-head, spreads, totals
+                'oddsFormat': 'decimal',
+                'dateFormat': 'iso'
+            }
+            
+            response = self._make_request(url, params=params)
+            
+            if response and response.status_code == 200:
+                odds_data = orjson.loads(response.content)
+                logger.info(f"Retrieved odds for {len(odds_data)} {sport_name} events")
+                
+                # Check remaining quota
+                remaining = response.headers.get('x-requests-remaining')
+                if remaining:
+                    logger.info(f"API requests remaining: {remaining}")
+                return odds_data
+            
+            logger.warning(f"Failed to fetch odds for {sport_name}")
+            
+        except Exception as e:
+            logger.error(f"Error fetching odds for {sport_name}: {e}")
+        
+        return None
+    
     def parse_events(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Parse betting odds data into standardized format.
@@ -227,6 +309,8 @@ class BettingOddsCollector(BaseDataCollector):
             return []
         
         parsed_odds = []
+        # One timestamp for the whole batch rather than a clock read per event
+        scraped_at = datetime.now().isoformat()
         
         for sport_name, sport_odds in raw_data.items():
             if not sport_odds:
@@ -234,7 +318,7 @@ class BettingOddsCollector(BaseDataCollector):
             
             for event in sport_odds:
                 try:
-                    odds_entry = self._parse_single_event(event, sport_name)
+                    odds_entry = self._parse_single_event(event, sport_name, scraped_at)
                     if odds_entry:
                         parsed_odds.append(odds_entry)
                 except Exception as e:
@@ -244,13 +328,15 @@ class BettingOddsCollector(BaseDataCollector):
         logger.info(f"Parsed {len(parsed_odds)} betting odds entries")
         return parsed_odds
     
-    def _parse_single_event(self, event: Dict[str, Any], sport: str) -> Optional[Dict[str, Any]]:
+    def _parse_single_event(self, event: Dict[str, Any], sport: str,
+                            scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Parse a single betting odds event.
         
         Args:
             event: Raw event data from API
             sport: Sport name
+            scraped_at: ISO timestamp shared by the batch (defaults to now)
         
         Returns:
             Parsed odds entry
@@ -274,20 +360,18 @@ class BettingOddsCollector(BaseDataCollector):
                     market_key = market.get('key', '')
                     outcomes = market.get('outcomes', [])
                     
-                    market_odds = {
+                    odds_data.append({
                         'bookmaker': bookmaker_name,
                         'market': market_key,
-                        'outcomes': []
-                    }
-                    
-                    for outcome in outcomes:
-                        market_odds['outcomes'].append({
-                            'name': outcome.get('name', ''),
-                            'price': outcome.get('price', 0),
-                            'point': outcome.get('point')  # For spreads/totals
-                        })
-                    
-                    odds_data.append(market_odds)
+                        'outcomes': [
+                            {
+                                'name': outcome.get('name', ''),
+                                'price': outcome.get('price', 0),
+                                'point': outcome.get('point')  # For spreads/totals
+                            }
+                            for outcome in outcomes
+                        ]
+                    })
             
             # Calculate implied probabilities and best odds
             best_odds = self._calculate_best_odds(odds_data, home_team, away_team)
@@ -302,7 +386,7 @@ class BettingOddsCollector(BaseDataCollector):
                 'odds_data': odds_data,
                 'best_odds': best_odds,
                 'bookmaker_count': len(bookmakers),
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at or datetime.now().isoformat()
             }
             
         except Exception as e:
@@ -322,11 +406,9 @@ class BettingOddsCollector(BaseDataCollector):
         Returns:
             Dictionary with best odds and probabilities
         """
-        best_odds = {
-            'home': {'price': 0, 'bookmaker': None, 'probability': 0},
-            'away': {'price': 0, 'bookmaker': None, 'probability': 0},
-            'draw': {'price': 0, 'bookmaker': None, 'probability': 0}
-        }
+        # Track only (price, bookmaker) while scanning; probabilities are
+        # worked out once per outcome at the end rather than per quote
+        best = {'home': (0, None), 'away': (0, None), 'draw': (0, None)}
         
         for odds in odds_data:
             if odds['market'] != 'h2h':  # Focus on head-to-head for now
@@ -336,35 +418,30 @@ class BettingOddsCollector(BaseDataCollector):
             
             for outcome in odds['outcomes']:
                 name = outcome['name']
-                price = outcome['price']
-                
-                # Decimal odds to implied probability: probability = 1 / decimal_odds
-                probability = (1 / price * 100) if price > 0 else 0
                 
                 # Determine which team/outcome
                 if name == home_team:
-                    if price > best_odds['home']['price']:
-                        best_odds['home'] = {
-                            'price': price,
-                            'bookmaker': bookmaker,
-                            'probability': round(probability, 2)
-                        }
+                    key = 'home'
                 elif name == away_team:
-                    if price > best_odds['away']['price']:
-                        best_odds['away'] = {
-                            'price': price,
-                            'bookmaker': bookmaker,
-                            'probability': round(probability, 2)
-                        }
+                    key = 'away'
                 elif name.lower() == 'draw':
-                    if price > best_odds['draw']['price']:
-                        best_odds['draw'] = {
-                            'price': price,
-                            'bookmaker': bookmaker,
-                            'probability': round(probability, 2)
-                        }
-        
-        return best_odds
+                    key = 'draw'
+                else:
+                    continue
+                
+                price = outcome['price']
+                if price > best[key][0]:
+                    best[key] = (price, bookmaker)
+        
+        # Decimal odds to implied probability: probability = 1 / decimal_odds
+        return {
+            key: {
+                'price': price,
+                'bookmaker': bookmaker,
+                'probability': round(1 / price * 100, 2) if price > 0 else 0
+            }
+            for key, (price, bookmaker) in best.items()
+        }
     
     def get_odds_for_event(self, event_name: str, sport: str) -> Optional[Dict[str, Any]]:
         """
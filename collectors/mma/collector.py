@@ -10,6 +10,51 @@ from utils.base_collector import BaseDataCollector
 from utils.event_schema import create_event
 
 
+def _detect_leagues(event_title: str) -> List[str]:
+    """
+    Work out the promotion from a UFC.com event title.
+    
+    Args:
+        event_title: Event card title as scraped
+    
+    Returns:
+        Single-item league list; anything unmatched is UFC
+    """
+    title = event_title.lower()
+    if "bellator" in title:
+        return ["Bellator"]
+    if "one" in title and "championship" in title:
+        return ["ONE Championship"]
+    if "pfl" in title:
+        return ["PFL"]
+    return ["UFC"]
+
+
+def _candidate_date_patterns(clean_date: str) -> tuple:
+    """
+    Pick the strptime patterns that can match a cleaned MMA date string.
+    
+    Args:
+        clean_date: Date string with stray punctuation removed
+    
+    Returns:
+        Tuple of patterns to try, most likely first
+    """
+    if len(clean_date) > 4 and clean_date[4] == '-':
+        return ("%Y-%m-%d",)      # 2025-01-15
+    if '/' in clean_date:
+        return ("%m/%d/%Y",       # 01/15/2025
+                "%d/%m/%Y")       # 15/01/2025
+    if '.' in clean_date:
+        return ("%d.%m.%Y",)      # 15.01.2025
+    
+    # Month-name formats: "January 15, 2025", "Jan 15" (current year)
+    month_len = len(clean_date.split(' ', 1)[0])
+    if ',' in clean_date:
+        return ("%b %d, %Y",) if month_len == 3 else ("%B %d, %Y",)
+    return ("%b %d",) if month_len == 3 else ("%B %d",)
+
+
 class MMACollector(BaseDataCollector):
     """Collects MMA/UFC schedule data using web scraping."""
     
@@ -120,20 +165,15 @@ class MMACollector(BaseDataCollector):
                     participants = fighters[:2] if len(fighters) >= 2 else ["TBD", "TBD"]
                     
                     # Determine league/organization
-                    leagues = ["UFC"]
-                    if "bellator" in event_title.lower():
-                        leagues = ["Bellator"]
-                    elif "one" in event_title.lower() and "championship" in event_title.lower():
-                        leagues = ["ONE Championship"]
-                    elif "pfl" in event_title.lower():
-                        leagues = ["PFL"]
+                    leagues = _detect_leagues(event_title)
                     
                     # Try to extract watch link
                     watch_link = None
                     links = container.find_all('a', href=True)
                     for link in links:
                         href = link.get('href', '')
-                        if 'watch' in href.lower() or 'stream' in href.lower() or 'ppv' in href.lower():
+                        href_lc = href.lower()
+                        if 'watch' in href_lc or 'stream' in href_lc or 'ppv' in href_lc:
                             if href.startswith('http'):
                                 watch_link = href
                             elif href.startswith('/'):
@@ -203,7 +243,8 @@ class MMACollector(BaseDataCollector):
                 links = element.find_all('a', href=True)
                 for link in links:
                     href = link.get('href', '')
-                    if 'watch' in href.lower() or 'stream' in href.lower():
+                    href_lc = href.lower()
+                    if 'watch' in href_lc or 'stream' in href_lc:
                         watch_link = href if href.startswith('http') else f"https://www.mmafighting.com{href}"
                         break
                 if not watch_link:
@@ -267,7 +308,8 @@ class MMACollector(BaseDataCollector):
                 links = element.find_all('a', href=True)
                 for link in links:
                     href = link.get('href', '')
-                    if 'event' in href.lower() or 'fightcenter' in href.lower():
+                    href_lc = href.lower()
+                    if 'event' in href_lc or 'fightcenter' in href_lc:
                         watch_link = href if href.startswith('http') else f"https://www.tapology.com{href}"
                         break
                 if not watch_link:
@@ -307,22 +349,12 @@ class MMACollector(BaseDataCollector):
             return (datetime.now() + timedelta(days=7)).isoformat() + "Z"
         
         try:
-            # Common patterns for MMA dates
-            patterns = [
-                "%B %d, %Y",      # January 15, 2025
-                "%b %d, %Y",      # Jan 15, 2025
-                "%m/%d/%Y",       # 01/15/2025
-                "%d/%m/%Y",       # 15/01/2025
-                "%Y-%m-%d",       # 2025-01-15
-                "%d.%m.%Y",       # 15.01.2025
-                "%B %d",          # January 15 (current year)
-                "%b %d",          # Jan 15 (current year)
-            ]
-            
             # Clean the date string
             clean_date = re.sub(r'[^\w\s,./:-]', '', date_string).strip()
             
-            for pattern in patterns:
+            # Only try the formats whose shape matches, so a typical date
+            # costs a single strptime call instead of a chain of ValueErrors
+            for pattern in _candidate_date_patterns(clean_date):
                 try:
                     if "%Y" not in pattern:
                         # Add current year if not specified
@@ -2,14 +2,160 @@
 NFL data collector using web scraping.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Union
+import calendar
 import re
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from utils.base_collector import BaseDataCollector
 from utils.event_schema import create_event
 
 
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def _tag_xpath(axis: str, tags: List[str], words: List[str], first: bool = False) -> etree.XPath:
+    """
+    Compile an XPath selecting tags whose class contains any of the words.
+    
+    Matching is case-insensitive, like the class_=re.compile(..., re.I)
+    filters these expressions replace, but runs entirely inside libxml2.
+    
+    Args:
+        axis: Location path prefix, e.g. '//' for the document or './/' for descendants
+        tags: Element names to accept
+        words: Lowercase substrings to look for
+        first: Select only the first match, letting libxml2 stop the walk early
+    
+    Returns:
+        Compiled XPath callable
+    """
+    lowered = f"translate(@class, '{_UPPER}', '{_LOWER}')"
+    tag_test = ' or '.join(f'self::{tag}' for tag in tags)
+    word_test = ' or '.join(f"contains({lowered}, '{word}')" for word in words)
+    path = f"{axis}*[{tag_test}][{word_test}]"
+    return etree.XPath(f"({path})[1]" if first else path)
+
+
+# ESPN schedule selectors
+_ESPN_GAME_XP = _tag_xpath('//', ['tr', 'div'], ['game', 'event', 'matchup', 'row'])
+_ESPN_TEAM_XP = _tag_xpath('.//', ['abbr', 'span', 'a'], ['team', 'abbr'])
+_ESPN_TIME_XP = _tag_xpath('.//', ['time', 'span'], ['time', 'date'], first=True)
+_ESPN_VENUE_XP = etree.XPath(
+    "(.//*[self::span or self::div][count(node()) = 1]"
+    f"[contains(text(), '@') or contains(translate(text(), '{_UPPER}', '{_LOWER}'), 'vs')"
+    f" or contains(translate(text(), '{_UPPER}', '{_LOWER}'), 'stadium')"
+    f" or contains(translate(text(), '{_UPPER}', '{_LOWER}'), 'field')])[1]"
+)
+
+# NFL.com schedule selectors
+_NFL_GAME_XP = _tag_xpath('//', ['div', 'article'], ['game', 'schedule', 'matchup'])
+_NFL_TEAM_XP = _tag_xpath('.//', ['span', 'div'], ['team', 'name'])
+_NFL_DATE_XP = _tag_xpath('.//', ['time', 'span'], ['date', 'time'], first=True)
+_NFL_VENUE_XP = _tag_xpath('.//', ['span', 'div'], ['venue', 'stadium', 'location'], first=True)
+
+_TEXT_XP = etree.XPath('.//text()')
+
+# Every accepted NFL date shape in one anchored pattern:
+#   "07/20/2025 1:00 PM", "07/20 1:00 PM", "Sun 07/20 1:00 PM",
+#   "July 20, 2025 1:00 PM", "July 20 1:00 PM"
+_NFL_DATE_RE = re.compile(r"""
+    ^(?:[A-Za-z]{3}\s+)?                                   # optional weekday
+    (?:
+        (?P<month>\d{1,2})/(?P<day>\d{1,2})(?:/(?P<year>\d{4}))?
+      | (?P<month_name>[A-Za-z]+)\s+(?P<name_day>\d{1,2})(?:,\s*(?P<name_year>\d{4}))?
+    )
+    \s+(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<ampm>[AaPp][Mm])$
+""", re.VERBOSE)
+
+_MONTH_NUMBERS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names) if name
+}
+
+
+def _match_nfl_date(date_str: str, current_year: int) -> Optional[datetime]:
+    """
+    Parse an NFL date string with _NFL_DATE_RE in a single match.
+    
+    Args:
+        date_str: Date string from NFL website
+        current_year: Year to use when the string has none
+    
+    Returns:
+        Parsed datetime, or None if the string is not a recognised date
+    """
+    match = _NFL_DATE_RE.match(date_str)
+    if not match:
+        return None
+    
+    if match.group('month'):
+        month = int(match.group('month'))
+        day = int(match.group('day'))
+        year = match.group('year')
+    else:
+        month = _MONTH_NUMBERS.get(match.group('month_name').lower())
+        if month is None:
+            return None
+        day = int(match.group('name_day'))
+        year = match.group('name_year')
+    
+    hour = int(match.group('hour'))
+    if not 1 <= hour <= 12:
+        return None
+    if match.group('ampm').lower() == 'pm':
+        hour = hour % 12 + 12
+    else:
+        hour = hour % 12
+    
+    try:
+        return datetime(int(year) if year else current_year, month, day, hour, int(match.group('minute')))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _parse_nfl_date_cached(date_str: str, today_iso: str) -> Optional[str]:
+    """
+    Parse an NFL date string to ISO format, memoized per string and day.
+    
+    A week's schedule repeats the same kickoff strings for many games, so
+    most calls are cache hits.
+    
+    Args:
+        date_str: Date string from NFL website
+        today_iso: Today's date; part of the cache key so yearless dates
+            pick up the current year and entries go stale daily
+    
+    Returns:
+        ISO formatted date string, or None if no pattern matches
+    """
+    parsed_date = _match_nfl_date(date_str, int(today_iso[:4]))
+    return parsed_date.isoformat() + "Z" if parsed_date is not None else None
+
+
+def _default_game_date() -> str:
+    """Return next Sunday at 1 PM ET (typical NFL game time) in ISO format."""
+    now = datetime.now()
+    next_sunday = now + timedelta(days=(6 - now.weekday()) % 7)
+    return next_sunday.replace(hour=13, minute=0, second=0, microsecond=0).isoformat() + "Z"
+
+
+def _text(element) -> str:
+    """Return an element's text with each fragment stripped, like get_text(strip=True)."""
+    return ''.join(fragment.strip() for fragment in _TEXT_XP(element))
+
+
+def _first_text(xpath: etree.XPath, element) -> str:
+    """Return the text of the first node matched by xpath, or an empty string."""
+    matches = xpath(element)
+    return _text(matches[0]) if matches else ""
+
+
 class NFLCollector(BaseDataCollector):
     """Collects NFL schedule data using web scraping."""
     
@@ -20,32 +166,37 @@ class NFLCollector(BaseDataCollector):
             "https://www.nfl.com/schedules/"
         ]
     
-    def fetch_raw_data(self) -> Dict[str, str]:
+    def fetch_raw_data(self) -> Dict[str, bytes]:
         """
         Fetch NFL schedules from multiple sources.
         
         Returns:
-            Dictionary with source URLs as keys and HTML content as values
+            Dictionary with source URLs as keys and raw HTML bytes as values
         """
-        results = {}
-        
-        for source in self.sources:
-            try:
-                response = self.make_request(source)
-                results[source] = response.text
+        # Request every source at once and keep whichever answers first, so
+        # a slow or down source no longer delays the fallback
+        executor = ThreadPoolExecutor(max_workers=len(self.sources))
+        futures = {executor.submit(self.make_request, source): source for source in self.sources}
+        try:
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    response = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Failed to fetch from {source}: {e}")
+                    continue
+                
                 self.logger.info(f"Successfully fetched data from {source}")
-                break  # Use first successful source
-            except Exception as e:
-                self.logger.warning(f"Failed to fetch from {source}: {e}")
-                continue
-        
-        if not results:
-            self.logger.warning("No NFL sources were accessible")
-            return {}
+                # Hand lxml the undecoded body; it reads the page's charset
+                # itself, skipping requests' decode and str copy
+                return {source: response.content}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        return results
+        self.logger.warning("No NFL sources were accessible")
+        return {}
     
-    def parse_events(self, raw_data: Dict[str, str]) -> List[Dict]:
+    def parse_events(self, raw_data: Dict[str, Union[str, bytes]]) -> List[Dict]:
         """
         Parse NFL data from HTML content into standardized format.
         
@@ -55,24 +206,14 @@ class NFLCollector(BaseDataCollector):
         Returns:
             List of standardized event dictionaries
         """
-        events = []
-        
-        for source_url, html_content in raw_data.items():
-            try:
-                if "espn.com" in source_url:
-                    events.extend(self._parse_espn_nfl(html_content))
-                elif "nfl.com" in source_url:
-                    events.extend(self._parse_nfl_official(html_content))
-                    
-            except Exception as e:
-                self.logger.error(f"Error parsing NFL data from {source_url}: {e}")
-                continue
-        
-        # Remove duplicates
+        # Remove duplicates as events stream in, keyed on day + name
+        # joined by a unit separator; callers such as the API routes and
+        # webhooks use these events directly, so the events table's unique
+        # index is only a backstop
         unique_events = []
         seen = set()
-        for event in events:
-            key = (event['event'], event['date'][:10])
+        for event in self._iter_source_events(raw_data):
+            key = f"{event['date'][:10]}\x1f{event['event']}"
             if key not in seen:
                 seen.add(key)
                 unique_events.append(event)
@@ -80,85 +221,87 @@ class NFLCollector(BaseDataCollector):
         self.logger.info(f"Parsed {len(unique_events)} unique NFL events")
         return unique_events
     
-    def _parse_espn_nfl(self, html_content: str) -> List[Dict]:
+    def _iter_source_events(self, raw_data: Dict[str, Union[str, bytes]]) -> Iterator[Dict]:
+        """
+        Yield events from every source, skipping sources that fail to parse.
+        
+        Args:
+            raw_data: Dictionary with HTML content from sources
+        
+        Yields:
+            Standardized event dictionaries
+        """
+        for source_url, html_content in raw_data.items():
+            if "espn.com" in source_url:
+                parser = self._parse_espn_nfl
+            elif "nfl.com" in source_url:
+                parser = self._parse_nfl_official
+            else:
+                continue
+            
+            try:
+                yield from parser(html_content)
+            except Exception as e:
+                self.logger.error(f"Error parsing NFL data from {source_url}: {e}")
+                continue
+    
+    def _parse_espn_nfl(self, html_content: Union[str, bytes]) -> Iterator[Dict]:
         """Parse ESPN NFL schedule."""
-        events = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        root = lxml_html.fromstring(html_content)
         
         # Look for game containers
-        game_elements = soup.find_all(['tr', 'div'], class_=re.compile(r'game|event|matchup|row', re.I))
-        
-        for element in game_elements:
+        for element in _ESPN_GAME_XP(root):
             try:
                 # Extract team names/abbreviations
-                team_elements = element.find_all(['abbr', 'span', 'a'], class_=re.compile(r'team|abbr', re.I))
-                teams = [elem.get_text(strip=True) for elem in team_elements if elem.get_text(strip=True)]
+                teams = [text for text in map(_text, _ESPN_TEAM_XP(element)) if text]
                 
                 # Extract date/time
-                time_elem = element.find(['time', 'span'], class_=re.compile(r'time|date', re.I))
-                game_date = self._parse_nfl_date(time_elem.get_text(strip=True) if time_elem else "")
+                game_date = self._parse_nfl_date(_first_text(_ESPN_TIME_XP, element))
                 
                 # Extract venue
-                venue_elem = element.find(['span', 'div'], text=re.compile(r'@|vs|Stadium|Field', re.I))
-                venue = venue_elem.get_text(strip=True) if venue_elem else "TBD"
+                venue = _first_text(_ESPN_VENUE_XP, element) or "TBD"
                 
                 if len(teams) >= 2:
-                    event = create_event(
+                    yield create_event(
                         sport="nfl",
                         date=game_date,
                         event=f"{teams[0]} vs {teams[1]}",
                         participants=teams[:2],
                         location=venue
                     )
-                    events.append(event)
                     
             except Exception as e:
                 self.logger.debug(f"Error parsing ESPN NFL game: {e}")
                 continue
-        
-        return events
     
-    def _parse_nfl_official(self, html_content: str) -> List[Dict]:
+    def _parse_nfl_official(self, html_content: Union[str, bytes]) -> Iterator[Dict]:
         """Parse NFL official website schedule."""
-        events = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        root = lxml_html.fromstring(html_content)
         
         # Look for game containers on NFL.com
-        game_containers = soup.find_all(['div', 'article'], class_=re.compile(r'game|schedule|matchup', re.I))
-        
-        for container in game_containers:
+        for container in _NFL_GAME_XP(root):
             try:
                 # Extract team information
-                teams = []
-                team_elements = container.find_all(['span', 'div'], class_=re.compile(r'team|name', re.I))
-                for elem in team_elements:
-                    team_text = elem.get_text(strip=True)
-                    if team_text and len(team_text) > 1:
-                        teams.append(team_text)
+                teams = [text for text in map(_text, _NFL_TEAM_XP(container)) if len(text) > 1]
                 
                 # Extract date/time
-                date_elem = container.find(['time', 'span'], class_=re.compile(r'date|time', re.I))
-                game_date = self._parse_nfl_date(date_elem.get_text(strip=True) if date_elem else "")
+                game_date = self._parse_nfl_date(_first_text(_NFL_DATE_XP, container))
                 
                 # Extract venue
-                venue_elem = container.find(['span', 'div'], class_=re.compile(r'venue|stadium|location', re.I))
-                venue = venue_elem.get_text(strip=True) if venue_elem else "TBD"
+                venue = _first_text(_NFL_VENUE_XP, container) or "TBD"
                 
                 if len(teams) >= 2:
-                    event = create_event(
+                    yield create_event(
                         sport="nfl",
                         date=game_date,
                         event=f"{teams[0]} vs {teams[1]}",
                         participants=teams[:2],
                         location=venue
                     )
-                    events.append(event)
                     
             except Exception as e:
                 self.logger.debug(f"Error parsing NFL game container: {e}")
                 continue
-        
-        return events
     
     def _parse_nfl_date(self, date_str: str) -> str:
         """
@@ -173,35 +316,16 @@ class NFLCollector(BaseDataCollector):
         try:
             if not date_str:
                 # Default to next Sunday at 1 PM ET (typical NFL game time)
-                next_sunday = datetime.now() + timedelta(days=(6 - datetime.now().weekday()) % 7)
-                return next_sunday.replace(hour=13, minute=0, second=0, microsecond=0).isoformat() + "Z"
+                return _default_game_date()
             
-            # Common NFL date patterns
-            patterns = [
-                "%m/%d/%Y %I:%M %p",  # "07/20/2025 1:00 PM"
-                "%m/%d %I:%M %p",     # "07/20 1:00 PM"
-                "%B %d, %Y %I:%M %p", # "July 20, 2025 1:00 PM"
-                "%B %d %I:%M %p",     # "July 20 1:00 PM"
-                "%a %m/%d %I:%M %p",  # "Sun 07/20 1:00 PM"
-            ]
-            
-            current_year = datetime.now().year
-            
-            for pattern in patterns:
-                try:
-                    parsed_date = datetime.strptime(date_str, pattern)
-                    if parsed_date.year == 1900:
-                        parsed_date = parsed_date.replace(year=current_year)
-                    return parsed_date.isoformat() + "Z"
-                except ValueError:
-                    continue
+            parsed_date = _parse_nfl_date_cached(date_str, date.today().isoformat())
+            if parsed_date is not None:
+                return parsed_date
             
             # If no pattern matches, return default NFL game time
             self.logger.warning(f"Could not parse NFL date: {date_str}")
-            next_sunday = datetime.now() + timedelta(days=(6 - datetime.now().weekday()) % 7)
-            return next_sunday.replace(hour=13, minute=0, second=0, microsecond=0).isoformat() + "Z"
+            return _default_game_date()
             
         except Exception as e:
             self.logger.warning(f"Error parsing NFL date '{date_str}': {e}")
-            next_sunday = datetime.now() + timedelta(days=(6 - datetime.now().weekday()) % 7)
-            return next_sunday.replace(hour=13, minute=0, second=0, microsecond=0).isoformat() + "Z"
+            return _default_game_date()
@@ -6,6 +6,18 @@ Adds the project root directory to the Python path to allow imports.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture
+def db():
+    """Provide a DatabaseManager backed by a private in-memory database."""
+    from utils import DatabaseManager
+    
+    manager = DatabaseManager(':memory:')
+    yield manager
+    manager.close()
@@ -14,8 +14,9 @@ Fetches and stores daily schedules for:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Scheduler imports
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -28,6 +29,9 @@ from collectors import COLLECTORS, get_collector
 # Configure logging
 logger = get_logger(__name__)
 
+# Collectors are network-bound, so fetch every sport at once
+MAX_FETCH_WORKERS = len(COLLECTORS)
+
 
 class SportsCalendarApp:
     """Main application class."""
@@ -37,15 +41,15 @@ class SportsCalendarApp:
         self.health_monitor = HealthMonitor()
         self.supported_sports = list(COLLECTORS.keys())
     
-    def fetch_sport_events(self, sport: str) -> int:
+    def collect_sport_events(self, sport: str) -> Optional[List[Dict]]:
         """
-        Fetch events for a specific sport.
+        Fetch events for a specific sport without storing them.
         
         Args:
             sport: Sport name
         
         Returns:
-            Number of new events inserted
+            Fetched events, or None if the fetch failed
         """
         try:
             # Start timing the operation
@@ -57,34 +61,79 @@ class SportsCalendarApp:
             # Fetch events
             events = collector.fetch_events()
             
-            # Store events in database
-            inserted = self.db.insert_events(events)
-            
             # Record successful fetch
             self.health_monitor.record_successful_fetch(sport)
             
             # End timing
             duration = self.health_monitor.metrics.end_timer(f"{sport}_fetch")
-            logger.info(f"Fetched {len(events)} {sport} events in {duration:.2f}s, inserted {inserted} new events")
+            logger.info(f"Fetched {len(events)} {sport} events in {duration:.2f}s")
             
-            return inserted
+            return events
             
         except Exception as e:
             self.health_monitor.record_fetch_error(sport, type(e).__name__)
             logger.error(f"Failed to fetch {sport} events: {e}")
+            return None
+    
+    def fetch_sport_events(self, sport: str) -> int:
+        """
+        Fetch events for a specific sport.
+        
+        Args:
+            sport: Sport name
+        
+        Returns:
+            Number of new events inserted
+        """
+        events = self.collect_sport_events(sport)
+        if events is None:
+            return 0
+        
+        try:
+            # Store events in database
+            inserted = self.db.insert_events(events)
+            logger.info(f"Inserted {inserted} new {sport} events")
+            return inserted
+        except Exception as e:
+            self.health_monitor.record_fetch_error(sport, type(e).__name__)
+            logger.error(f"Failed to store {sport} events: {e}")
             return 0
     
+    def _timed_fetch(self, sport: str, fetch: Callable[[str], Any]) -> Tuple[Any, float]:
+        """Run one sport's fetch, returning its result (or the error) and the duration."""
+        start_time = datetime.now()
+        try:
+            result = fetch(sport)
+        except Exception as e:
+            result = e
+        return result, (datetime.now() - start_time).total_seconds()
+    
+    def fetch_sports_concurrently(self, fetch: Optional[Callable[[str], Any]] = None) -> Dict[str, Tuple[Any, float]]:
+        """
+        Fetch all supported sports in parallel threads.
+        
+        Args:
+            fetch: Per-sport fetch function; defaults to fetch_sport_events
+        
+        Returns:
+            Dictionary mapping sport name to (fetch result or raised error, duration in seconds),
+            in the order of supported_sports
+        """
+        fetch = fetch or self.fetch_sport_events
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            futures = {}
+            for sport in self.supported_sports:
+                logger.info(f"Fetching {sport} events...")
+                futures[sport] = executor.submit(self._timed_fetch, sport, fetch)
+            return {sport: future.result() for sport, future in futures.items()}
+    
     def fetch_all_sports(self) -> int:
         """Fetch events for all supported sports."""
-        total_inserted = 0
-        
         logger.info("Starting fetch for all sports...")
         self.health_monitor.metrics.start_timer("fetch_all")
         
-        for sport in self.supported_sports:
-            logger.info(f"Fetching {sport} events...")
-            inserted = self.fetch_sport_events(sport)
-            total_inserted += inserted
+        fetched = self.fetch_sports_concurrently()
+        total_inserted = sum(result for result, _ in fetched.values() if isinstance(result, int))
         
         duration = self.health_monitor.metrics.end_timer("fetch_all")
         logger.info(f"Completed fetch for all sports in {duration:.2f}s. Total new events: {total_inserted}")
@@ -110,21 +159,17 @@ class SportsCalendarApp:
         print(f"\n🗓️  Fetching all sports data for {month_name}")
         print("=" * 60)
         
-        for sport in self.supported_sports:
-            start_time = datetime.now()
-            try:
-                print(f"📡 Collecting {sport.upper()} events...")
-                new_events = self.fetch_sport_events(sport)
-                results[sport] = new_events
-                
-                duration = (datetime.now() - start_time).total_seconds()
-                status_icon = "✅" if new_events > 0 else "⚪"
-                print(f"   {status_icon} {sport.upper()}: {new_events} new events ({duration:.1f}s)")
-                
-            except Exception as e:
-                logger.error(f"Failed to fetch {sport} events: {e}")
+        for sport, (new_events, duration) in self.fetch_sports_concurrently().items():
+            print(f"📡 Collecting {sport.upper()} events...")
+            if isinstance(new_events, Exception):
+                logger.error(f"Failed to fetch {sport} events: {new_events}")
                 results[sport] = 0
-                print(f"   ❌ {sport.upper()}: Failed - {str(e)[:50]}...")
+                print(f"   ❌ {sport.upper()}: Failed - {str(new_events)[:50]}...")
+                continue
+            
+            results[sport] = new_events
+            status_icon = "✅" if new_events > 0 else "⚪"
+            print(f"   {status_icon} {sport.upper()}: {new_events} new events ({duration:.1f}s)")
         
         total_duration = (datetime.now() - total_start_time).total_seconds()
         total_events = sum(results.values())
@@ -166,21 +211,32 @@ class SportsCalendarApp:
         print(f"\n📅 Backfilling data for {month_name} {year}")
         print("=" * 60)
         
-        for sport in self.supported_sports:
-            start_time = datetime.now()
-            try:
-                print(f"🔄 Backfilling {sport.upper()} events...")
-                new_events = self.fetch_sport_events(sport)
-                results[sport] = new_events
-                
-                duration = (datetime.now() - start_time).total_seconds()
-                status_icon = "✅" if new_events > 0 else "⚪"
-                print(f"   {status_icon} {sport.upper()}: {new_events} events added ({duration:.1f}s)")
-                
-            except Exception as e:
-                logger.error(f"Failed to backfill {sport} events: {e}")
+        # Fetch everything first so the query indexes are only dropped while
+        # the (possibly large) insert runs, not for the whole network phase
+        collected = self.fetch_sports_concurrently(self.collect_sport_events)
+        
+        fetch_results = {}
+        with self.db.bulk_load():
+            for sport, (events, duration) in collected.items():
+                if not isinstance(events, list):
+                    fetch_results[sport] = (events or 0, duration)
+                    continue
+                try:
+                    fetch_results[sport] = (self.db.insert_events(events), duration)
+                except Exception as e:
+                    fetch_results[sport] = (e, duration)
+        
+        for sport, (new_events, duration) in fetch_results.items():
+            print(f"🔄 Backfilling {sport.upper()} events...")
+            if isinstance(new_events, Exception):
+                logger.error(f"Failed to backfill {sport} events: {new_events}")
                 results[sport] = 0
-                print(f"   ❌ {sport.upper()}: Failed - {str(e)[:50]}...")
+                print(f"   ❌ {sport.upper()}: Failed - {str(new_events)[:50]}...")
+                continue
+            
+            results[sport] = new_events
+            status_icon = "✅" if new_events > 0 else "⚪"
+            print(f"   {status_icon} {sport.upper()}: {new_events} events added ({duration:.1f}s)")
         
         total_duration = (datetime.now() - total_start_time).total_seconds()
         total_events = sum(results.values())
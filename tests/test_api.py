@@ -0,0 +1,20 @@
+"""
+Tests for the FastAPI application.
+"""
+
+from fastapi.testclient import TestClient
+
+from api.app import create_app
+
+
+class TestMetricsEndpoint:
+    """Test the Prometheus scrape endpoint."""
+    
+    def test_metrics_served_without_redirect(self):
+        """Test that /metrics answers directly in the Prometheus text format."""
+        client = TestClient(create_app())
+        
+        response = client.get("/metrics", follow_redirects=False)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
@@ -2,10 +2,10 @@
 Tests for betting odds collector functionality.
 """
 
+import orjson
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from collectors.betting import BettingOddsCollector
-from utils import DatabaseManager
 
 
 class TestBettingOddsCollector:
@@ -70,7 +70,7 @@ class TestBettingOddsCollector:
             result = collector.fetch_raw_data()
             assert result is None
     
-    @patch('collectors.betting.collector.requests.get')
+    @patch('collectors.betting.collector.requests.Session.get')
     def test_make_request_success(self, mock_get):
         """Test successful HTTP request."""
         mock_response = Mock()
@@ -84,11 +84,13 @@ class TestBettingOddsCollector:
         assert response is not None
         assert response.status_code == 200
     
-    @patch('collectors.betting.collector.requests.get')
-    def test_make_request_rate_limit_retry(self, mock_get):
+    @patch('collectors.betting.collector.time.sleep')
+    @patch('collectors.betting.collector.requests.Session.get')
+    def test_make_request_rate_limit_retry(self, mock_get, mock_sleep):
         """Test retry on rate limit (429)."""
         mock_response = Mock()
         mock_response.status_code = 429
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         collector = BettingOddsCollector()
@@ -96,8 +98,23 @@ class TestBettingOddsCollector:
         
         response = collector._make_request("http://test.com")
         
-        # Should have retried multiple times
+        # Should have retried multiple times, backing off at least 5s
         assert mock_get.call_count > 1
+        assert max(call[0][0] for call in mock_sleep.call_args_list) >= 5
+    
+    @patch('collectors.betting.collector.time.sleep')
+    @patch('collectors.betting.collector.requests.Session.get')
+    def test_make_request_honors_retry_after(self, mock_get, mock_sleep):
+        """Test that a 429 Retry-After header sets the wait before retrying."""
+        limited = Mock(status_code=429, headers={'Retry-After': '42'})
+        ok = Mock(status_code=200, headers={})
+        mock_get.side_effect = [limited, ok]
+        
+        collector = BettingOddsCollector()
+        collector.min_request_interval = 0.01
+        
+        assert collector._make_request("http://test.com") is ok
+        assert 42 in [call[0][0] for call in mock_sleep.call_args_list]
     
     def test_parse_events_empty_data(self):
         """Test parsing with empty data."""
@@ -178,116 +195,125 @@ class TestBettingOddsCollector:
 class TestDatabaseBettingOdds:
     """Test database operations for betting odds."""
     
-    def test_insert_betting_odds(self):
+    def test_insert_betting_odds(self, db):
         """Test inserting betting odds into database."""
-        import tempfile
-        import os
+        test_odds = [
+            {
+                'event_id': 'test_123',
+                'sport': 'nfl',
+                'commence_time': '2025-11-01T19:00:00Z',
+                'home_team': 'Team A',
+                'away_team': 'Team B',
+                'participants': ['Team A', 'Team B'],
+                'odds_data': [{'bookmaker': 'Test', 'market': 'h2h', 'outcomes': []}],
+                'best_odds': {'home': {'price': 2.5}, 'away': {'price': 2.8}},
+                'bookmaker_count': 1
+            }
+        ]
         
-        # Create temporary database file
-        fd, db_path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
+        count = db.insert_betting_odds(test_odds)
+        assert count == 1
         
-        try:
-            db = DatabaseManager(db_path)
-            
-            test_odds = [
-                {
-                    'event_id': 'test_123',
-                    'sport': 'nfl',
-                    'commence_time': '2025-11-01T19:00:00Z',
-                    'home_team': 'Team A',
-                    'away_team': 'Team B',
-                    'participants': ['Team A', 'Team B'],
-                    'odds_data': [{'bookmaker': 'Test', 'market': 'h2h', 'outcomes': []}],
-                    'best_odds': {'home': {'price': 2.5}, 'away': {'price': 2.8}},
-                    'bookmaker_count': 1
-                }
-            ]
-            
-            count = db.insert_betting_odds(test_odds)
-            assert count == 1
-            
-            # Try inserting same odds again (should update, not duplicate)
-            count = db.insert_betting_odds(test_odds)
-            assert count == 1
-        finally:
-            # Clean up
-            if os.path.exists(db_path):
-                os.remove(db_path)
+        # Try inserting same odds again (should update, not duplicate)
+        test_odds[0]['bookmaker_count'] = 3
+        count = db.insert_betting_odds(test_odds)
+        assert count == 1
+        
+        rows = db._conn.execute('SELECT id, bookmaker_count FROM betting_odds').fetchall()
+        assert rows == [(1, 3)]
     
-    def test_get_all_betting_odds(self):
+    def test_insert_unserializable_odds_returns_zero(self, db):
+        """Test that a payload that cannot be serialized is logged, not raised."""
+        test_odds = [
+            {
+                'event_id': 'test_123',
+                'sport': 'nfl',
+                'commence_time': '2025-11-01T19:00:00Z',
+                'participants': ['Team A', 'Team B'],
+                'odds_data': [object()],
+            }
+        ]
+        
+        assert db.insert_betting_odds(test_odds) == 0
+        assert db._conn.execute('SELECT COUNT(*) FROM betting_odds').fetchone() == (0,)
+    
+    def test_get_all_betting_odds(self, db):
         """Test retrieving all betting odds."""
-        import tempfile
-        import os
+        from datetime import datetime, timedelta
         
-        fd, db_path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
+        # get_all_betting_odds only returns upcoming events
+        future_date = (datetime.now() + timedelta(days=7)).isoformat() + 'Z'
         
-        try:
-            db = DatabaseManager(db_path)
-            
-            test_odds = [
-                {
-                    'event_id': 'test_123',
-                    'sport': 'nfl',
-                    'commence_time': '2025-11-01T19:00:00Z',
-                    'home_team': 'Team A',
-                    'away_team': 'Team B',
-                    'participants': ['Team A', 'Team B'],
-                    'odds_data': [],
-                    'best_odds': {},
-                    'bookmaker_count': 1
-                }
-            ]
-            
-            db.insert_betting_odds(test_odds)
-            
-            odds = db.get_all_betting_odds(sport='nfl')
-            assert len(odds) == 1
-            assert odds[0]['sport'] == 'nfl'
-        finally:
-            if os.path.exists(db_path):
-                os.remove(db_path)
+        test_odds = [
+            {
+                'event_id': 'test_123',
+                'sport': 'nfl',
+                'commence_time': future_date,
+                'home_team': 'Team A',
+                'away_team': 'Team B',
+                'participants': ['Team A', 'Team B'],
+                'odds_data': [],
+                'best_odds': {},
+                'bookmaker_count': 1
+            }
+        ]
+        
+        db.insert_betting_odds(test_odds)
+        
+        odds = db.get_all_betting_odds(sport='nfl')
+        assert len(odds) == 1
+        assert odds[0]['sport'] == 'nfl'
     
-    def test_get_odds_for_event(self):
+    def test_get_odds_for_event(self, db):
         """Test retrieving odds for specific event."""
-        import tempfile
-        import os
         from datetime import datetime, timedelta
         
-        fd, db_path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
+        # Use future date
+        future_date = (datetime.now() + timedelta(days=7)).isoformat() + 'Z'
         
-        try:
-            db = DatabaseManager(db_path)
-            
-            # Use future date
-            future_date = (datetime.now() + timedelta(days=7)).isoformat() + 'Z'
-            
-            test_odds = [
-                {
-                    'event_id': 'test_123',
-                    'sport': 'nfl',
-                    'commence_time': future_date,
-                    'home_team': 'Kansas City Chiefs',
-                    'away_team': 'Buffalo Bills',
-                    'participants': ['Kansas City Chiefs', 'Buffalo Bills'],
-                    'odds_data': [],
-                    'best_odds': {},
-                    'bookmaker_count': 1
-                }
-            ]
-            
-            db.insert_betting_odds(test_odds)
-            
-            # Search by participant name
-            odds = db.get_odds_for_event('nfl', ['Kansas City'])
-            assert odds is not None
-            assert odds['home_team'] == 'Kansas City Chiefs'
-        finally:
-            if os.path.exists(db_path):
-                os.remove(db_path)
-
+        test_odds = [
+            {
+                'event_id': 'test_123',
+                'sport': 'nfl',
+                'commence_time': future_date,
+                'home_team': 'Kansas City Chiefs',
+                'away_team': 'Buffalo Bills',
+                'participants': ['Kansas City Chiefs', 'Buffalo Bills'],
+                'odds_data': [],
+                'best_odds': {},
+                'bookmaker_count': 1
+            }
+        ]
+        
+        db.insert_betting_odds(test_odds)
+        
+        # Search by participant name
+        odds = db.get_odds_for_event('nfl', ['Kansas City'])
+        assert odds is not None
+        assert odds['home_team'] == 'Kansas City Chiefs'
+    
+    def test_get_odds_for_event_folds_non_ascii_case(self, db):
+        """Test that participant matching ignores case beyond ASCII letters."""
+        from datetime import datetime, timedelta
+        
+        future_date = (datetime.now() + timedelta(days=7)).isoformat() + 'Z'
+        db.insert_betting_odds([
+            {
+                'event_id': 'test_456',
+                'sport': 'soccer',
+                'commence_time': future_date,
+                'home_team': 'ÖSTERSUNDS FK',
+                'away_team': 'ÉTOILE CAROUGE',
+                'participants': ['ÖSTERSUNDS FK', 'ÉTOILE CAROUGE'],
+                'odds_data': [],
+                'best_odds': {},
+                'bookmaker_count': 1
+            }
+        ])
+        
+        odds = db.get_odds_for_event('soccer', ['Östersunds'])
+        assert odds is not None
+        assert odds['event_id'] == 'test_456'
 
 
 def test_betting_scheduler_initialization():
@@ -300,5 +326,40 @@ def test_betting_scheduler_initialization():
     assert not scheduler.is_running
 
 
+def test_betting_scheduler_sends_one_batched_webhook_per_run():
+    """Test that a collection run posts a single coalesced payload per webhook."""
+    from utils.betting_scheduler import BettingOddsScheduler
+    from utils.webhook import DeliveryResult
+    
+    scheduler = BettingOddsScheduler(interval_minutes=60)
+    scheduler.collector = Mock()
+    scheduler.collector.fetch_raw_data.return_value = {'nfl': [], 'nba': []}
+    scheduler.collector.parse_events.return_value = [
+        {'event_id': 'a', 'sport': 'nfl'},
+        {'event_id': 'b', 'sport': 'nfl'},
+        {'event_id': 'c', 'sport': 'nba'}
+    ]
+    scheduler.db = Mock()
+    scheduler.db.insert_betting_odds.return_value = 3
+    scheduler.webhook.db = scheduler.db
+    scheduler.db.get_webhook_configs.return_value = [
+        {'name': 'one', 'url': 'https://example.com/one'},
+        {'name': 'two', 'url': 'https://example.com/two'}
+    ]
+    
+    result = DeliveryResult('one', 'https://example.com/one', True, 200, 1)
+    with patch.object(scheduler.webhook, '_deliver_to_webhook', return_value=result) as deliver:
+        scheduler.collect_and_notify()
+    
+    assert deliver.call_count == 2
+    payload = orjson.loads(deliver.call_args[0][1])
+    assert payload['event_type'] == 'betting_odds_update'
+    assert payload['odds_updated'] == 3
+    assert payload['batch'] == [
+        {'sport': 'nfl', 'events': 2},
+        {'sport': 'nba', 'events': 1}
+    ]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,176 @@
+"""
+Tests for event storage in the database manager.
+"""
+
+
+def _make_events(count, sport='nfl'):
+    """Build distinct future events for insertion."""
+    return [
+        {
+            'sport': sport,
+            'date': '2030-01-01T13:00:00Z',
+            'event': f'Event {i}',
+            'participants': ['Team A', 'Team B'],
+            'location': 'Stadium'
+        }
+        for i in range(count)
+    ]
+
+
+class TestEventStorage:
+    """Test event insert and sync bookkeeping."""
+    
+    def test_mark_synced_beyond_parameter_limit(self, db):
+        """Test marking more events than SQLite allows bound parameters."""
+        db.insert_events(_make_events(2500))
+        event_ids = [event['id'] for event in db.get_unsynced_events()]
+        
+        db.mark_synced(event_ids[:2000])
+        
+        assert len(db.get_unsynced_events()) == 500
+    
+    def test_get_upcoming_events_window(self, db):
+        """Test that only events between now and the day window are returned."""
+        from datetime import datetime, timedelta, timezone
+        
+        now = datetime.now(timezone.utc)
+        events = _make_events(4)
+        for event, hours in zip(events, (-2, 2, 48, 24 * 10)):
+            event['date'] = (now + timedelta(hours=hours)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        db.insert_events(events)
+        
+        upcoming = db.get_upcoming_events('nfl', days=7)
+        
+        assert [event['event'] for event in upcoming] == ['Event 1', 'Event 2']
+        assert upcoming[0]['participants'] == ['Team A', 'Team B']
+        assert upcoming[0]['leagues'] == []
+    
+    def test_concurrent_writers_and_readers(self, tmp_path):
+        """Test inserts and reads from many threads on a file database."""
+        from concurrent.futures import ThreadPoolExecutor
+        from utils import DatabaseManager
+        
+        db = DatabaseManager(str(tmp_path / 'events.db'))
+        
+        def insert_batch(batch):
+            events = _make_events(100)
+            for event in events:
+                event['event'] = f"{event['event']} batch {batch}"
+            db.insert_events(events)
+            return db.get_event_count()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                counts = list(executor.map(insert_batch, range(16)))
+            
+            assert max(counts) == 1600
+            assert db.get_event_count() == 1600
+        finally:
+            db.close()
+    
+    def test_insert_event_skips_duplicates(self, db):
+        """Test single inserts report whether a new row was written."""
+        event = _make_events(1)[0]
+        
+        assert db.insert_event(event) is True
+        assert db.insert_event(event) is False
+        assert db.get_event_count() == 1
+    
+    def test_cached_reads_see_own_writes(self, db):
+        """Test that cached queries are refreshed after writes through the manager."""
+        from datetime import datetime, timedelta, timezone
+        
+        assert db.get_webhook_configs() == []
+        db.add_webhook_config('hook', 'https://example.com/hook')
+        assert [config['name'] for config in db.get_webhook_configs()] == ['hook']
+        
+        assert db.get_upcoming_events('nfl') == []
+        event = _make_events(1)[0]
+        event['date'] = (datetime.now(timezone.utc) + timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        db.insert_event(event)
+        assert len(db.get_upcoming_events('nfl')) == 1
+    
+    def test_same_name_at_different_times_is_kept(self, db):
+        """Test that only exact sport/date/event repeats count as duplicates."""
+        events = _make_events(1) * 2 + _make_events(1)
+        events[2] = dict(events[2], date='2030-01-01T19:00:00Z')
+        
+        assert db.insert_events(events) == 2
+        assert db.get_event_count() == 2
+    
+    def test_migration_keeps_existing_duplicates(self, tmp_path):
+        """Test that opening a database with duplicate rows never deletes them."""
+        from utils import DatabaseManager
+        
+        db_path = str(tmp_path / 'events.db')
+        manager = DatabaseManager(db_path)
+        with manager._connect() as cursor:
+            cursor.execute('DROP INDEX ux_events_sport_date_event')
+            for _ in range(2):
+                cursor.execute(
+                    "INSERT INTO events (sport, date, event, participants) VALUES ('nfl', '2030-01-01T13:00:00Z', 'Event 0', '[]')"
+                )
+            cursor.execute('PRAGMA user_version = 0')
+        manager.close()
+        
+        reopened = DatabaseManager(db_path)
+        try:
+            assert reopened.get_event_count() == 2
+            assert reopened.insert_events(_make_events(1)) == 0
+        finally:
+            reopened.close()
+    
+    def test_cached_rows_are_copies(self, db):
+        """Test that callers modifying cached results don't change later reads."""
+        db.add_webhook_config('hook', 'https://example.com/hook')
+        configs = db.get_webhook_configs()
+        configs[0]['url'] = 'http://127.0.0.1/'
+        configs.clear()
+        
+        assert db.get_webhook_configs()[0]['url'] == 'https://example.com/hook'
+    
+    def test_load_racing_invalidation_is_not_cached(self, db):
+        """Test that rows loaded while a write invalidated the query aren't kept."""
+        loads = []
+        
+        def load():
+            loads.append(1)
+            if len(loads) == 1:
+                db._invalidate('webhooks')
+            return [{'name': f'load {len(loads)}'}]
+        
+        assert db._cached(('webhooks',), 60, load) == [{'name': 'load 1'}]
+        assert db._cached(('webhooks',), 60, load) == [{'name': 'load 2'}]
+        assert db._cached(('webhooks',), 60, load) == [{'name': 'load 2'}]
+    
+    def test_bulk_load_rebuilds_indexes(self, db):
+        """Test that bulk_load drops query indexes and restores them afterwards."""
+        def index_names():
+            rows = db._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+            return {row[0] for row in rows}
+        
+        before = index_names()
+        with db.bulk_load():
+            assert 'idx_sport_date' not in index_names()
+            assert 'ux_events_sport_date_event' in index_names()
+            db.insert_events(_make_events(10))
+        
+        assert index_names() == before
+        assert db.get_event_count() == 10
+    
+    def test_interrupted_bulk_load_indexes_restored_on_open(self, tmp_path):
+        """Test that indexes dropped by an interrupted bulk load come back on the next open."""
+        from utils import DatabaseManager
+        
+        db_path = str(tmp_path / 'events.db')
+        manager = DatabaseManager(db_path)
+        with manager._connect() as cursor:
+            cursor.execute('DROP INDEX idx_sport_date')
+        manager.close()
+        
+        reopened = DatabaseManager(db_path)
+        try:
+            rows = reopened._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+            assert 'idx_sport_date' in {row[0] for row in rows}
+        finally:
+            reopened.close()
@@ -0,0 +1,56 @@
+"""
+Tests for NFL collector parsing.
+"""
+
+import pytest
+from collectors.nfl import NFLCollector
+
+
+class TestNFLDateParsing:
+    """Test NFL date string parsing."""
+
+    @pytest.mark.parametrize("date_str, expected", [
+        ("07/20/2025 1:00 PM", "2025-07-20T13:00:00Z"),
+        ("July 20, 2025 1:00 PM", "2025-07-20T13:00:00Z"),
+        ("12/01/2025 12:30 AM", "2025-12-01T00:30:00Z"),
+        ("12/01/2025 12:30 PM", "2025-12-01T12:30:00Z"),
+    ])
+    def test_parse_dates_with_year(self, date_str, expected):
+        """Test parsing date strings that include a year."""
+        collector = NFLCollector()
+        assert collector._parse_nfl_date(date_str) == expected
+
+    def test_parse_date_without_year_uses_current_year(self):
+        """Test that dates without a year default to the current year."""
+        from datetime import datetime
+
+        collector = NFLCollector()
+        result = collector._parse_nfl_date("Sun 07/20 1:00 PM")
+        assert result == f"{datetime.now().year}-07-20T13:00:00Z"
+
+    def test_invalid_date_defaults_to_sunday(self):
+        """Test that unparseable dates fall back to Sunday 1 PM."""
+        from datetime import datetime
+
+        collector = NFLCollector()
+        for date_str in ["", "02/30/2025 1:00 PM", "not a date"]:
+            result = collector._parse_nfl_date(date_str)
+            parsed = datetime.fromisoformat(result.replace('Z', ''))
+            assert parsed.weekday() == 6
+            assert parsed.hour == 13
+
+
+class TestNFLParseEvents:
+    """Test NFL event parsing across sources."""
+
+    def test_duplicate_games_are_dropped(self):
+        """Test that the same game from several rows or sources is returned once."""
+        from unittest.mock import patch
+
+        game = {'date': '2025-09-07T13:00:00Z', 'event': 'Bills vs Jets'}
+        other = {'date': '2025-09-07T16:25:00Z', 'event': 'Chiefs vs Ravens'}
+        collector = NFLCollector()
+        with patch.object(collector, '_iter_source_events', return_value=iter([game, dict(game), other])):
+            events = collector.parse_events({})
+
+        assert [event['event'] for event in events] == ['Bills vs Jets', 'Chiefs vs Ravens']
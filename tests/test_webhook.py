@@ -0,0 +1,118 @@
+"""
+Tests for webhook URL validation.
+"""
+
+import socket
+
+import pytest
+from unittest.mock import patch
+from utils import webhook
+from utils.webhook import WebhookDelivery, flush_webhook_queue
+
+
+class TestWebhookUrlValidation:
+    """Test SSRF protection on webhook URLs."""
+
+    @pytest.mark.parametrize("url", [
+        "http://127.0.0.1/hook",
+        "http://10.1.2.3/hook",
+        "http://172.31.0.1/hook",
+        "http://192.168.1.10/hook",
+        "http://169.254.169.254/latest",
+        "http://[::1]/hook",
+        "http://[fd00::1]/hook",
+        "http://[::ffff:10.0.0.1]/hook",
+        "ftp://8.8.8.8/hook",
+        "http:///hook",
+    ])
+    def test_rejects_internal_urls(self, url):
+        """Test that internal addresses and bad schemes are rejected."""
+        assert not WebhookDelivery()._is_safe_webhook_url(url)
+
+    @pytest.mark.parametrize("url", [
+        "http://8.8.8.8/hook",
+        "https://172.32.0.1/hook",
+        "https://[2606:4700:4700::1111]/hook",
+    ])
+    def test_accepts_public_urls(self, url):
+        """Test that public addresses are accepted."""
+        assert WebhookDelivery()._is_safe_webhook_url(url)
+
+
+class TestWebhookHostResolution:
+    """Test caching of DNS-based host checks."""
+
+    PUBLIC = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('93.184.216.34', 0))]
+    PRIVATE = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.5', 0))]
+
+    def setup_method(self):
+        WebhookDelivery.clear_url_cache()
+
+    def test_lookup_failure_is_not_remembered(self):
+        """Test that a transient DNS failure doesn't block the host afterwards."""
+        with patch.object(webhook.socket, 'getaddrinfo', side_effect=socket.gaierror('temporary failure')):
+            assert not webhook._is_public_host('hooks.example.com')
+        with patch.object(webhook.socket, 'getaddrinfo', return_value=self.PUBLIC):
+            assert webhook._is_public_host('hooks.example.com')
+
+    def test_url_recovers_after_lookup_failure(self):
+        """Test that a URL rejected during a DNS outage is accepted once DNS recovers."""
+        url = 'https://hooks.example.com/events'
+        with patch.object(webhook.socket, 'getaddrinfo', side_effect=socket.gaierror('temporary failure')):
+            assert not WebhookDelivery()._is_safe_webhook_url(url)
+        with patch.object(webhook.socket, 'getaddrinfo', return_value=self.PUBLIC):
+            assert WebhookDelivery()._is_safe_webhook_url(url)
+
+    def test_verdict_expires_after_ttl(self):
+        """Test that a host is resolved again once its verdict is older than the TTL."""
+        with patch.object(webhook.socket, 'getaddrinfo', return_value=self.PUBLIC):
+            assert webhook._is_public_host('hooks.example.com')
+        with patch.object(webhook.socket, 'getaddrinfo', return_value=self.PRIVATE) as lookup:
+            assert webhook._is_public_host('hooks.example.com')
+            assert lookup.call_count == 0
+            with patch.object(webhook.time, 'monotonic', return_value=webhook.time.monotonic() + webhook.HOST_CHECK_TTL):
+                assert not webhook._is_public_host('hooks.example.com')
+
+    def test_rebound_host_is_refused_at_connect(self):
+        """Test that the session refuses a connection that lands on an internal address."""
+        import requests
+
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        session = requests.Session()
+        session.mount('http://', webhook._PublicOnlyAdapter())
+        try:
+            with pytest.raises(requests.exceptions.ConnectionError, match='internal address'):
+                session.post(f'http://127.0.0.1:{listener.getsockname()[1]}/hook', timeout=5)
+        finally:
+            session.close()
+            listener.close()
+
+
+class TestWebhookQueue:
+    """Test background webhook delivery."""
+
+    def test_queued_bursts_are_coalesced_in_order(self):
+        """Test that batches queued together are sent as one ordered payload."""
+        delivery = WebhookDelivery()
+        with patch.object(WebhookDelivery, 'send_new_events', return_value={'success': True}) as send:
+            assert delivery.queue_new_events([{'id': 1}])
+            assert delivery.queue_new_events([{'id': 2}, {'id': 3}])
+            flush_webhook_queue()
+
+        assert send.call_count == 1
+        assert [event['id'] for event in send.call_args[0][0]] == [1, 2, 3]
+
+
+    def test_flush_gives_up_after_timeout(self):
+        """Test that flushing returns False instead of waiting on a stuck delivery."""
+        import threading
+
+        release = threading.Event()
+        delivery = WebhookDelivery()
+        with patch.object(WebhookDelivery, 'send_new_events', side_effect=lambda events: release.wait(5)):
+            assert delivery.queue_new_events([{'id': 1}])
+            assert flush_webhook_queue(timeout=0.3) is False
+            release.set()
+            assert flush_webhook_queue(timeout=5)
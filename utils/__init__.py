@@ -6,17 +6,18 @@ used across all data collectors.
 """
 
 from .logger import get_logger
-from .database import DatabaseManager
+from .database import DatabaseManager, get_database_manager
 from .base_collector import BaseDataCollector
 from .calendar_sync import CalendarSync
 from .monitoring import HealthMonitor, MetricsCollector
 from .event_schema import EVENT_SCHEMA, validate_event
-from .webhook import WebhookDelivery
+from .webhook import WebhookDelivery, close_webhook_session, flush_webhook_queue
 from .betting_scheduler import BettingOddsScheduler, get_betting_odds_scheduler
 
 __all__ = [
     'get_logger',
     'DatabaseManager',
+    'get_database_manager',
     'BaseDataCollector',
     'CalendarSync',
     'HealthMonitor',
@@ -24,6 +25,8 @@ __all__ = [
     'EVENT_SCHEMA',
     'validate_event',
     'WebhookDelivery',
+    'close_webhook_session',
+    'flush_webhook_queue',
     'BettingOddsScheduler',
     'get_betting_odds_scheduler'
 ]
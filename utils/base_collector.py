@@ -5,10 +5,17 @@ Base data collector class that all sport-specific collectors inherit from.
 import requests
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
 from .logger import LoggerMixin
 from .event_schema import validate_event
 
 
+# Connection pools shared by every collector's session, so keep-alive
+# connections to common hosts (several sports scrape espn.com) are reused
+# across collectors and across collector instances
+_SHARED_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+
+
 class BaseDataCollector(LoggerMixin, ABC):
     """Base class for all sports data collectors."""
     
@@ -16,6 +23,8 @@ class BaseDataCollector(LoggerMixin, ABC):
         self.sport_name = sport_name
         self.timeout = timeout
         self.session = requests.Session()
+        self.session.mount('https://', _SHARED_ADAPTER)
+        self.session.mount('http://', _SHARED_ADAPTER)
         self.session.headers.update({
             'User-Agent': f'Daily-Sports-Calendar-App/1.0 ({sport_name.upper()}-Collector)'
         })
@@ -3,12 +3,14 @@ Scheduled betting odds collection service.
 Continuously refreshes betting odds data via webhook mechanism.
 """
 
+from collections import Counter
 from datetime import datetime
+from typing import List, Dict, Any
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 import os
 
-from utils import DatabaseManager, get_logger, WebhookDelivery
+from utils import get_database_manager, get_logger, WebhookDelivery
 from collectors.betting import BettingOddsCollector
 
 logger = get_logger(__name__)
@@ -29,7 +31,7 @@ class BettingOddsScheduler:
         """
         self.scheduler = BackgroundScheduler()
         self.interval_minutes = interval_minutes
-        self.db = DatabaseManager()
+        self.db = get_database_manager()
         self.webhook = WebhookDelivery(self.db)
         self.collector = BettingOddsCollector()
         self.is_running = False
@@ -63,29 +65,44 @@ class BettingOddsScheduler:
             # Send webhook notifications if new odds were added
             if inserted > 0:
                 try:
-                    # Format odds for webhook payload
-                    webhook_payload = {
-                        "event_type": "betting_odds_update",
-                        "timestamp": datetime.now().isoformat(),
-                        "odds_updated": inserted,
-                        "sports": list(raw_data.keys())
-                    }
-                    
-                    # Get webhook configs
-                    webhook_configs = self.db.get_webhook_configs()
-                    
-                    if webhook_configs:
-                        logger.info(f"Sending odds update to {len(webhook_configs)} webhooks")
-                        # Note: We'd need to extend WebhookDelivery to support custom payloads
-                        # For now, just log the notification
-                        logger.info(f"Odds update notification: {webhook_payload}")
-                    
+                    self._notify_webhooks(parsed_odds, inserted)
                 except Exception as e:
                     logger.error(f"Error sending webhook notification: {e}")
             
         except Exception as e:
             logger.error(f"Error in scheduled betting odds collection: {e}")
     
+    def _notify_webhooks(self, parsed_odds: List[Dict[str, Any]], inserted: int):
+        """
+        Send one coalesced odds update to each configured webhook.
+        
+        Every sport refreshed in this run goes into a single batched payload,
+        so each endpoint receives one POST per collection rather than one per
+        sport or per event.
+        
+        Args:
+            parsed_odds: Odds entries parsed in this collection run
+            inserted: Number of entries written to the database
+        """
+        per_sport = Counter(odds.get('sport', '') for odds in parsed_odds)
+        
+        webhook_payload = {
+            "event_type": "betting_odds_update",
+            "timestamp": datetime.now().isoformat(),
+            "odds_updated": inserted,
+            "sports": list(per_sport),
+            "batch": [
+                {"sport": sport, "events": count}
+                for sport, count in per_sport.items()
+            ]
+        }
+        
+        result = self.webhook.send_payload(webhook_payload)
+        if result.get('total_webhooks'):
+            logger.info(
+                f"Sent odds update to {result['webhooks_notified']}/{result['total_webhooks']} webhooks"
+            )
+    
     def start(self):
         """Start the scheduler."""
         if self.is_running:
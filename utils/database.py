@@ -4,23 +4,284 @@ Handles SQLite database operations for sports events.
 """
 
 import sqlite3
-import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import orjson
+import threading
+import time
+from contextlib import closing, contextmanager
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Iterator, Optional, Tuple
 from .logger import LoggerMixin
 
 
+# Applied to the manager's connection: WAL only needs fsync at checkpoints, so
+# synchronous=NORMAL is still durable against application crashes
+_CONNECTION_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+'''
+
+# Seconds that get_webhook_configs / get_upcoming_events results are reused
+_WEBHOOK_CACHE_TTL = 5.0
+_UPCOMING_CACHE_TTL = 60.0
+
+# Stored in PRAGMA user_version once init_database has run; bump it whenever
+# the tables, columns or indexes in init_database change
+_SCHEMA_VERSION = 2
+
+# Secondary indexes on events that only speed up reads; bulk_load drops them
+# while loading and rebuilds them afterwards. The unique dedupe index stays.
+_EVENT_QUERY_INDEXES = {
+    'idx_sport_date': 'CREATE INDEX IF NOT EXISTS idx_sport_date ON events(sport, date)',
+    'idx_scraped_at': 'CREATE INDEX IF NOT EXISTS idx_scraped_at ON events(scraped_at)',
+    'idx_leagues': 'CREATE INDEX IF NOT EXISTS idx_leagues ON events(leagues)',
+    'idx_events_date': 'CREATE INDEX IF NOT EXISTS idx_events_date ON events(date)'
+}
+
+# Stays below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999)
+_MAX_SQL_PARAMS = 900
+
+# Hot-path statements, kept as module constants so every call hands the
+# driver the identical string and hits its prepared-statement cache
+# Skips an event already stored with the same sport, date and event name,
+# whether or not the unique index below could be created
+_SQL_INSERT_EVENT = '''
+    INSERT OR IGNORE INTO events (sport, date, event, participants, location, leagues, watch_link, scraped_at)
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, CURRENT_TIMESTAMP
+    WHERE NOT EXISTS (SELECT 1 FROM events WHERE sport = ?1 AND date = ?2 AND event = ?3)
+'''
+
+_SQL_UPCOMING_BY_SPORT = '''
+    SELECT sport, date, event, participants AS "participants [json]",
+           location, leagues AS "leagues [json]"
+    FROM events
+    WHERE sport = ? AND date >= ? AND date <= ?
+    ORDER BY date
+'''
+
+_SQL_UPCOMING = '''
+    SELECT sport, date, event, participants AS "participants [json]",
+           location, leagues AS "leagues [json]"
+    FROM events
+    WHERE date >= ? AND date <= ?
+    ORDER BY date
+'''
+
+_EVENT_COLUMNS = 'id, sport, date, event, participants, location, leagues, watch_link, scraped_at'
+
+_SQL_EVENTS_BY_SPORT = f'''
+    SELECT {_EVENT_COLUMNS}
+    FROM events
+    WHERE sport = ?
+    ORDER BY date DESC
+    LIMIT ?
+'''
+
+_SQL_ALL_EVENTS = f'''
+    SELECT {_EVENT_COLUMNS}
+    FROM events
+    ORDER BY date DESC
+    LIMIT ?
+'''
+
+_SQL_EVENT_BY_ID = f'''
+    SELECT {_EVENT_COLUMNS}
+    FROM events
+    WHERE id = ?
+'''
+
+# Updates an existing odds row in place, keeping its id and created_at
+_SQL_UPSERT_ODDS = '''
+    INSERT INTO betting_odds
+    (event_id, sport, commence_time, home_team, away_team,
+     participants, odds_data, best_odds, bookmaker_count, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(event_id, sport, commence_time) DO UPDATE SET
+        home_team = excluded.home_team,
+        away_team = excluded.away_team,
+        participants = excluded.participants,
+        odds_data = excluded.odds_data,
+        best_odds = excluded.best_odds,
+        bookmaker_count = excluded.bookmaker_count,
+        scraped_at = excluded.scraped_at
+'''
+
+# Columns selected as "name [json]" are decoded by the driver as rows are fetched
+sqlite3.register_converter('json', orjson.loads)
+
+
+_ISO_SECONDS = '%Y-%m-%dT%H:%M:%S'
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as ISO-8601 text.
+    
+    Event dates and odds commence times are stored as ISO-8601 UTC strings,
+    so comparing them against this value as text orders them in time and
+    lets the date/commence_time indexes serve the range.
+    """
+    return datetime.now(timezone.utc).strftime(_ISO_SECONDS)
+
+
+def _open_connection(database: str, uri: bool = False) -> sqlite3.Connection:
+    """Open a connection configured the way DatabaseManager expects."""
+    conn = sqlite3.connect(
+        database, uri=uri, check_same_thread=False, detect_types=sqlite3.PARSE_COLNAMES
+    )
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+
+def _dumps(value) -> str:
+    """Serialize a value to JSON text for a TEXT column (json_each rejects BLOBs)."""
+    return orjson.dumps(value).decode()
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """
+    Fetch the remaining rows of a query as dicts keyed by column name.
+    
+    Rows come back as plain tuples and are zipped against the column names
+    read once from the cursor, which is cheaper than building a sqlite3.Row
+    per row and then copying it into a dict.
+    """
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor]
+
+
+def _copy_rows(rows: List[Dict]) -> List[Dict]:
+    """Copy rows and their JSON list/dict values so callers can't alter cached ones."""
+    return [
+        {key: value.copy() if isinstance(value, (list, dict)) else value for key, value in row.items()}
+        for row in rows
+    ]
+
+
+def _event_row(event: Dict) -> tuple:
+    """Build the _SQL_INSERT_EVENT parameters for an event."""
+    return (
+        event['sport'],
+        event['date'],
+        event['event'],
+        _dumps(event['participants']),
+        event['location'],
+        _dumps(event.get('leagues', [])),
+        event.get('watch_link')
+    )
+
+
 class DatabaseManager(LoggerMixin):
     """Handles SQLite database operations for sports events."""
     
     def __init__(self, db_name: str = 'sports_calendar.db'):
         self.db_name = db_name
+        # One long-lived writer connection per manager, serialized by a lock
+        # so transactions from different threads don't interleave
+        self._lock = threading.RLock()
+        self._conn = _open_connection(db_name)
+        # Readers get their own read-only connection per thread; under WAL
+        # they run alongside the writer instead of queueing on its lock.
+        # An in-memory database is private to one connection, so it has none.
+        self._in_memory = db_name == ':memory:' or db_name.startswith('file::memory:')
+        self._readers = threading.local()
+        # Short-lived results for polled queries; writes through this manager
+        # invalidate them, writes from elsewhere show up once they expire.
+        # A per-query generation, bumped after each committed write, keeps a
+        # load that raced with the write from storing its stale rows.
+        self._read_cache: Dict[tuple, Tuple[float, List[Dict]]] = {}
+        self._cache_generations: Dict[str, int] = {}
+        self._cache_lock = threading.Lock()
         self.init_database()
     
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run one write transaction on the shared connection.
+        
+        Commits when the block exits cleanly and rolls back if it raises.
+        The cursor is closed before the lock is released: cursors share the
+        connection's cached statements, and one finalized later on another
+        thread would reset a statement another writer is executing.
+        """
+        with self._lock, self._conn, closing(self._conn.cursor()) as cursor:
+            yield cursor
+    
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Cursor]:
+        """Run queries on this thread's read-only connection."""
+        if self._in_memory:
+            with self._connect() as cursor:
+                yield cursor
+            return
+        
+        conn = getattr(self._readers, 'conn', None)
+        if conn is None:
+            conn = _open_connection(f"{Path(self.db_name).resolve().as_uri()}?mode=ro", uri=True)
+            self._readers.conn = conn
+        with closing(conn.cursor()) as cursor:
+            yield cursor
+    
+    def _cached(self, key: tuple, ttl: float, load: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Return a recent result for a read query, running it when stale.
+        
+        Args:
+            key: Cache key; the first element names the query for _invalidate
+            ttl: Seconds a result stays fresh
+            load: Runs the query
+        
+        Returns:
+            Copies of the (possibly cached) rows, safe for the caller to modify
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._read_cache.get(key)
+            generation = self._cache_generations.get(key[0], 0)
+        
+        if hit is not None and now - hit[0] < ttl:
+            rows = hit[1]
+        else:
+            rows = load()
+            with self._cache_lock:
+                if self._cache_generations.get(key[0], 0) == generation:
+                    self._read_cache[key] = (now, rows)
+        return _copy_rows(rows)
+    
+    def _invalidate(self, query: str):
+        """Drop cached results for a query after a committed write that affects it."""
+        with self._cache_lock:
+            self._cache_generations[query] = self._cache_generations.get(query, 0) + 1
+            for key in list(self._read_cache):
+                if key[0] == query:
+                    del self._read_cache[key]
+    
+    def close(self):
+        """Close the writer connection and this thread's reader connection."""
+        reader = getattr(self._readers, 'conn', None)
+        if reader is not None:
+            reader.close()
+            self._readers.conn = None
+        with self._lock:
+            self._conn.close()
+    
     def init_database(self):
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        with self._connect() as cursor:
+            # The schema below only needs to run once per version bump; later
+            # managers on the same file skip the catalog probes entirely
+            cursor.execute('PRAGMA user_version')
+            if cursor.fetchone()[0] >= _SCHEMA_VERSION:
+                # bulk_load drops these; restore any lost to an interrupted load
+                for create_index in _EVENT_QUERY_INDEXES.values():
+                    cursor.execute(create_index)
+                return
+            
+            # WAL is persistent on the database file, so readers no longer
+            # block behind the scheduler's odds and event writes
+            cursor.execute('PRAGMA journal_mode=WAL')
             
             # Create the events table with all columns
             cursor.execute('''
@@ -52,10 +313,30 @@ class DatabaseManager(LoggerMixin):
                 cursor.execute('ALTER TABLE events ADD COLUMN watch_link TEXT')
                 self.logger.info("Added watch_link column to events table")
             
+            # One row per sport/date/event, the identity insert_events has
+            # always deduplicated on. Existing rows are never deleted here: if
+            # duplicates are already stored the index is skipped and inserts
+            # rely on their NOT EXISTS check alone.
+            cursor.execute('DROP INDEX IF EXISTS ux_events_sport_event_day')
+            cursor.execute('''
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM events GROUP BY sport, date, event HAVING COUNT(*) > 1
+                )
+            ''')
+            duplicate_groups = cursor.fetchone()[0]
+            if duplicate_groups:
+                self.logger.warning(
+                    f"Found {duplicate_groups} duplicated sport/date/event groups; "
+                    "not adding the unique events index"
+                )
+            else:
+                cursor.execute(
+                    'CREATE UNIQUE INDEX IF NOT EXISTS ux_events_sport_date_event ON events(sport, date, event)'
+                )
+            
             # Create index for faster queries
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_sport_date ON events(sport, date)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_scraped_at ON events(scraped_at)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_leagues ON events(leagues)')
+            for create_index in _EVENT_QUERY_INDEXES.values():
+                cursor.execute(create_index)
             
             # Create webhook_config table
             cursor.execute('''
@@ -90,219 +371,180 @@ class DatabaseManager(LoggerMixin):
             # Create index for faster odds queries
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_odds_sport_time ON betting_odds(sport, commence_time)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_odds_scraped ON betting_odds(scraped_at)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_odds_time ON betting_odds(commence_time)')
             
-            conn.commit()
+            cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
             self.logger.info("Database initialized successfully")
     
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """
+        Drop the read-only event indexes for a large load and rebuild them after.
+        
+        Building each index once over the finished table is cheaper than
+        updating it on every inserted row. Inserts made inside the block,
+        from any thread, still go through insert_events as usual.
+        """
+        with self._connect() as cursor:
+            for index_name in _EVENT_QUERY_INDEXES:
+                cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+        try:
+            yield
+        finally:
+            with self._connect() as cursor:
+                for create_index in _EVENT_QUERY_INDEXES.values():
+                    cursor.execute(create_index)
+            self.logger.info("Rebuilt event indexes after bulk load")
+    
     def insert_events(self, events: List[Dict]) -> int:
         """Insert new events into the database, avoiding duplicates."""
         if not events:
             return 0
         
-        inserted_count = 0
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            
-            for event in events:
-                # Check if event already exists
-                cursor.execute('''
-                    SELECT id FROM events 
-                    WHERE sport = ? AND date = ? AND event = ?
-                ''', (event['sport'], event['date'], event['event']))
-                
-                if cursor.fetchone() is None:
-                    cursor.execute('''
-                        INSERT INTO events (sport, date, event, participants, location, leagues, watch_link, scraped_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ''', (
-                        event['sport'],
-                        event['date'],
-                        event['event'],
-                        json.dumps(event['participants']),
-                        event['location'],
-                        json.dumps(event.get('leagues', [])),
-                        event.get('watch_link')
-                    ))
-                    inserted_count += 1
-            
-            conn.commit()
+        rows = [_event_row(event) for event in events]
+        
+        # Events already stored with the same sport, date and name are
+        # skipped; all rows go in under one transaction
+        with self._connect() as cursor:
+            cursor.executemany(_SQL_INSERT_EVENT, rows)
+            inserted_count = cursor.rowcount
+        self._invalidate('upcoming')
         
         self.logger.info(f"Inserted {inserted_count} new events into database")
         return inserted_count
     
     def get_upcoming_events(self, sport: Optional[str] = None, days: int = 7) -> List[Dict]:
         """Get upcoming events for a specific sport or all sports."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            
-            end_date = (datetime.now() + timedelta(days=days)).isoformat()
+        return self._cached(
+            ('upcoming', sport, days), _UPCOMING_CACHE_TTL,
+            lambda: self._query_upcoming_events(sport, days)
+        )
+    
+    def _query_upcoming_events(self, sport: Optional[str], days: int) -> List[Dict]:
+        """Run the upcoming events query."""
+        with self._read() as cursor:
+            # Bound once per call, in the same ISO-8601 form as the stored
+            # dates, so idx_sport_date / idx_events_date serve the range
+            now = datetime.now(timezone.utc)
+            start_date = now.strftime(_ISO_SECONDS)
+            end_date = (now + timedelta(days=days)).strftime(_ISO_SECONDS)
             
             if sport:
-                cursor.execute('''
-                    SELECT sport, date, event, participants, location, leagues
-                    FROM events 
-                    WHERE sport = ? AND date >= datetime('now') AND date <= ?
-                    ORDER BY date
-                ''', (sport, end_date))
+                cursor.execute(_SQL_UPCOMING_BY_SPORT, (sport, start_date, end_date))
             else:
-                cursor.execute('''
-                    SELECT sport, date, event, participants, location, leagues
-                    FROM events 
-                    WHERE date >= datetime('now') AND date <= ?
-                    ORDER BY date
-                ''', (end_date,))
+                cursor.execute(_SQL_UPCOMING, (start_date, end_date))
             
             events = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 events.append({
                     'sport': row[0],
                     'date': row[1],
                     'event': row[2],
-                    'participants': json.loads(row[3]),
+                    'participants': row[3],
                     'location': row[4],
-                    'leagues': json.loads(row[5]) if row[5] else []
+                    'leagues': row[5] or []
                 })
             
             return events
     
     def get_unsynced_events(self) -> List[Dict]:
         """Get events that haven't been synced to calendar."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        with self._read() as cursor:
             cursor.execute('''
-                SELECT id, sport, date, event, participants, location 
+                SELECT id, sport, date, event, participants AS "participants [json]", location 
                 FROM events 
                 WHERE synced_to_calendar = FALSE
                 ORDER BY date
             ''')
             
-            events = []
-            for row in cursor.fetchall():
-                events.append({
-                    'id': row[0],
-                    'sport': row[1],
-                    'date': row[2],
-                    'event': row[3],
-                    'participants': json.loads(row[4]),
-                    'location': row[5]
-                })
-            
-            return events
+            return _fetch_dicts(cursor)
     
     def mark_synced(self, event_ids: List[int]):
         """Mark events as synced to calendar."""
         if not event_ids:
             return
         
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            placeholders = ','.join('?' * len(event_ids))
-            cursor.execute(f'''
-                UPDATE events 
-                SET synced_to_calendar = TRUE 
-                WHERE id IN ({placeholders})
-            ''', event_ids)
-            conn.commit()
+        # Chunked to stay under SQLite's bound-parameter limit; every chunk
+        # is part of the same transaction
+        with self._connect() as cursor:
+            for start in range(0, len(event_ids), _MAX_SQL_PARAMS):
+                chunk = event_ids[start:start + _MAX_SQL_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    UPDATE events 
+                    SET synced_to_calendar = TRUE 
+                    WHERE id IN ({placeholders})
+                ''', chunk)
             
         self.logger.info(f"Marked {len(event_ids)} events as synced")
     
     def insert_event(self, event: Dict) -> bool:
         """Insert a single event into the database."""
-        return self.insert_events([event]) > 0
+        # The API collect routes insert one event at a time, so skip the
+        # batch path's list building and executemany for a single execute
+        with self._connect() as cursor:
+            cursor.execute(_SQL_INSERT_EVENT, _event_row(event))
+            inserted = cursor.rowcount > 0
+        self._invalidate('upcoming')
+        return inserted
     
     def get_event_count(self) -> int:
         """Get total count of events in database."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        with self._read() as cursor:
             cursor.execute('SELECT COUNT(*) FROM events')
             return cursor.fetchone()[0]
     
     def get_events_by_sport(self, sport: str, limit: int = 1000) -> List[Dict]:
         """Get all events for a specific sport."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, sport, date, event, participants, location, leagues, watch_link, scraped_at
-                FROM events 
-                WHERE sport = ?
-                ORDER BY date DESC
-                LIMIT ?
-            ''', (sport, limit))
+        with self._read() as cursor:
+            cursor.execute(_SQL_EVENTS_BY_SPORT, (sport, limit))
             
-            events = []
-            for row in cursor.fetchall():
-                events.append(dict(row))
-            
-            return events
+            return _fetch_dicts(cursor)
     
     def get_all_events(self, limit: int = 1000) -> List[Dict]:
         """Get all events from database."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, sport, date, event, participants, location, leagues, watch_link, scraped_at
-                FROM events 
-                ORDER BY date DESC
-                LIMIT ?
-            ''', (limit,))
+        with self._read() as cursor:
+            cursor.execute(_SQL_ALL_EVENTS, (limit,))
             
-            events = []
-            for row in cursor.fetchall():
-                events.append(dict(row))
-            
-            return events
+            return _fetch_dicts(cursor)
     
     def get_event_by_id(self, event_id: int) -> Optional[Dict]:
         """Get a specific event by ID."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, sport, date, event, participants, location, leagues, watch_link, scraped_at
-                FROM events 
-                WHERE id = ?
-            ''', (event_id,))
+        with self._read() as cursor:
+            cursor.execute(_SQL_EVENT_BY_ID, (event_id,))
             
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            rows = _fetch_dicts(cursor)
+            return rows[0] if rows else None
     
     def get_webhook_configs(self) -> List[Dict]:
         """Get all enabled webhook configurations."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        return self._cached(('webhooks',), _WEBHOOK_CACHE_TTL, self._query_webhook_configs)
+    
+    def _query_webhook_configs(self) -> List[Dict]:
+        """Run the enabled webhook configurations query."""
+        with self._read() as cursor:
             cursor.execute('''
                 SELECT id, name, url, enabled
                 FROM webhook_config 
                 WHERE enabled = TRUE
             ''')
             
-            configs = []
-            for row in cursor.fetchall():
-                configs.append(dict(row))
-            
-            return configs
+            return _fetch_dicts(cursor)
     
     def add_webhook_config(self, name: str, url: str, enabled: bool = True) -> int:
         """Add a new webhook configuration."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
+        with self._connect() as cursor:
             cursor.execute('''
                 INSERT OR REPLACE INTO webhook_config (name, url, enabled)
                 VALUES (?, ?, ?)
             ''', (name, url, enabled))
-            conn.commit()
-            return cursor.lastrowid
+            webhook_id = cursor.lastrowid
+        self._invalidate('webhooks')
+        return webhook_id
     
     def get_new_events_since(self, since_timestamp: str) -> List[Dict]:
         """Get events added since a specific timestamp."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        with self._read() as cursor:
             cursor.execute('''
                 SELECT id, sport, date, event, participants, location, leagues, watch_link, scraped_at
                 FROM events 
@@ -310,123 +552,115 @@ class DatabaseManager(LoggerMixin):
                 ORDER BY scraped_at ASC
             ''', (since_timestamp,))
             
-            events = []
-            for row in cursor.fetchall():
-                events.append(dict(row))
-            
-            return events
+            return _fetch_dicts(cursor)
     
     def insert_betting_odds(self, odds_data: List[Dict]) -> int:
         """Insert betting odds into database, updating existing entries."""
         if not odds_data:
             return 0
         
-        inserted_count = 0
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            
-            for odds in odds_data:
-                try:
-                    # Insert or replace odds entry
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO betting_odds 
-                        (event_id, sport, commence_time, home_team, away_team, 
-                         participants, odds_data, best_odds, bookmaker_count, scraped_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ''', (
-                        odds.get('event_id', ''),
-                        odds.get('sport', ''),
-                        odds.get('commence_time', ''),
-                        odds.get('home_team', ''),
-                        odds.get('away_team', ''),
-                        json.dumps(odds.get('participants', [])),
-                        json.dumps(odds.get('odds_data', [])),
-                        json.dumps(odds.get('best_odds', {})),
-                        odds.get('bookmaker_count', 0)
-                    ))
-                    inserted_count += 1
-                except Exception as e:
-                    self.logger.error(f"Error inserting betting odds: {e}")
-                    continue
-            
-            conn.commit()
+        # Insert or update all odds entries in one transaction; a failure,
+        # including a payload that will not serialize, rolls back the whole batch
+        try:
+            rows = [
+                (
+                    odds.get('event_id', ''),
+                    odds.get('sport', ''),
+                    odds.get('commence_time', ''),
+                    odds.get('home_team', ''),
+                    odds.get('away_team', ''),
+                    _dumps(odds.get('participants', [])),
+                    _dumps(odds.get('odds_data', [])),
+                    _dumps(odds.get('best_odds', {})),
+                    odds.get('bookmaker_count', 0)
+                )
+                for odds in odds_data
+            ]
+            with self._connect() as cursor:
+                cursor.executemany(_SQL_UPSERT_ODDS, rows)
+                inserted_count = cursor.rowcount
+        except (sqlite3.Error, TypeError, orjson.JSONEncodeError) as e:
+            self.logger.error(f"Error inserting betting odds: {e}")
+            return 0
         
         self.logger.info(f"Inserted/Updated {inserted_count} betting odds entries")
         return inserted_count
     
     def get_odds_for_event(self, sport: str, participants: List[str]) -> Optional[Dict]:
         """Get betting odds for a specific event by matching participants."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
+        with self._read() as cursor:
             # Get recent odds for this sport
             cursor.execute('''
                 SELECT id, event_id, sport, commence_time, home_team, away_team,
-                       participants, odds_data, best_odds, bookmaker_count, scraped_at
+                       participants AS "participants [json]", odds_data AS "odds_data [json]",
+                       best_odds AS "best_odds [json]", bookmaker_count, scraped_at
                 FROM betting_odds
                 WHERE sport = ?
-                AND datetime(commence_time) >= datetime('now')
+                AND commence_time >= ?
                 ORDER BY scraped_at DESC
                 LIMIT 100
-            ''', (sport,))
+            ''', (sport, _utc_now_iso()))
             
-            odds_entries = []
-            for row in cursor.fetchall():
-                odds_entries.append(dict(row))
-            
-            # Match by participants
-            for odds_entry in odds_entries:
-                odds_participants = json.loads(odds_entry['participants'])
-                # Check if any search term appears in any participant name (bidirectional)
-                for search_term in participants:
-                    search_term_lower = search_term.lower()
-                    for odds_participant in odds_participants:
-                        odds_participant_lower = odds_participant.lower()
-                        # Match if search term is in participant name or vice versa
-                        if search_term_lower in odds_participant_lower or odds_participant_lower in search_term_lower:
-                            # Parse JSON fields
-                            odds_entry['participants'] = odds_participants
-                            odds_entry['odds_data'] = json.loads(odds_entry['odds_data'])
-                            odds_entry['best_odds'] = json.loads(odds_entry['best_odds'])
-                            return odds_entry
-            
-            return None
+            odds_entries = _fetch_dicts(cursor)
+        
+        # Match in Python: any search term inside any participant name or vice
+        # versa. str.lower folds non-ASCII names that SQLite's lower() leaves
+        # alone, and the scan is capped at 100 rows, so SQL gains nothing here
+        search_terms = [term.lower() for term in participants]
+        for odds_entry in odds_entries:
+            for odds_participant in odds_entry['participants']:
+                odds_participant_lower = odds_participant.lower()
+                if any(term in odds_participant_lower or odds_participant_lower in term
+                       for term in search_terms):
+                    return odds_entry
+        
+        return None
     
     def get_all_betting_odds(self, sport: Optional[str] = None, limit: int = 100) -> List[Dict]:
         """Get all betting odds, optionally filtered by sport."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
+        with self._read() as cursor:
             if sport:
                 cursor.execute('''
                     SELECT id, event_id, sport, commence_time, home_team, away_team,
-                           participants, odds_data, best_odds, bookmaker_count, scraped_at
+                           participants AS "participants [json]", odds_data AS "odds_data [json]",
+                           best_odds AS "best_odds [json]", bookmaker_count, scraped_at
                     FROM betting_odds
                     WHERE sport = ?
-                    AND datetime(commence_time) >= datetime('now')
+                    AND commence_time >= ?
                     ORDER BY commence_time ASC
                     LIMIT ?
-                ''', (sport, limit))
+                ''', (sport, _utc_now_iso(), limit))
             else:
                 cursor.execute('''
                     SELECT id, event_id, sport, commence_time, home_team, away_team,
-                           participants, odds_data, best_odds, bookmaker_count, scraped_at
+                           participants AS "participants [json]", odds_data AS "odds_data [json]",
+                           best_odds AS "best_odds [json]", bookmaker_count, scraped_at
                     FROM betting_odds
-                    WHERE datetime(commence_time) >= datetime('now')
+                    WHERE commence_time >= ?
                     ORDER BY commence_time ASC
                     LIMIT ?
-                ''', (limit,))
-            
-            odds_list = []
-            for row in cursor.fetchall():
-                odds_entry = dict(row)
-                # Parse JSON fields
-                odds_entry['participants'] = json.loads(odds_entry['participants'])
-                odds_entry['odds_data'] = json.loads(odds_entry['odds_data'])
-                odds_entry['best_odds'] = json.loads(odds_entry['best_odds'])
-                odds_list.append(odds_entry)
+                ''', (_utc_now_iso(), limit))
             
-            return odds_list
+            return _fetch_dicts(cursor)
 
+
+# Global manager shared by the API so its read cache is reused across requests
+_shared_manager = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_database_manager() -> DatabaseManager:
+    """
+    Get or create the process-wide database manager.
+    
+    Returns:
+        DatabaseManager instance for the default database file
+    """
+    global _shared_manager
+    
+    if _shared_manager is None:
+        with _shared_manager_lock:
+            if _shared_manager is None:
+                _shared_manager = DatabaseManager()
+    
+    return _shared_manager
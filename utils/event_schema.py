@@ -4,6 +4,7 @@ Event schema definitions and validation utilities.
 
 from typing import Dict, List, Any
 from datetime import datetime
+from functools import lru_cache
 import json
 
 
@@ -18,6 +19,15 @@ EVENT_SCHEMA = {
     "watch_link": None  # Link to watch event online
 }
 
+# Required fields and their types, checked in one pass by validate_event
+_REQUIRED_FIELD_TYPES = (
+    ("sport", str),
+    ("date", str),
+    ("event", str),
+    ("participants", list),
+    ("location", str)
+)
+
 
 def validate_event(event: Dict[str, Any]) -> bool:
     """
@@ -29,35 +39,38 @@ def validate_event(event: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["sport", "date", "event", "participants", "location"]
-    
-    # Check all required fields are present
-    for field in required_fields:
-        if field not in event:
+    # Check all required fields are present and of the right type; a
+    # missing field comes back as None and fails the isinstance check
+    for field, field_type in _REQUIRED_FIELD_TYPES:
+        if not isinstance(event.get(field), field_type):
             return False
     
-    # Validate data types
-    if not isinstance(event["sport"], str):
-        return False
-    if not isinstance(event["date"], str):
-        return False
-    if not isinstance(event["event"], str):
-        return False
-    if not isinstance(event["participants"], list):
-        return False
-    if not isinstance(event["location"], str):
-        return False
-    
     # Validate leagues field (optional)
     if "leagues" in event and not isinstance(event["leagues"], list):
         return False
     
     # Validate date format (basic check)
+    return _is_iso_datetime(event["date"])
+
+
+@lru_cache(maxsize=1024)
+def _is_iso_datetime(value: str) -> bool:
+    """
+    Check that a string parses as an ISO 8601 datetime.
+    
+    Cached because a schedule repeats the same kickoff times many times and
+    every event is validated twice (in create_event and in fetch_events).
+    
+    Args:
+        value: Date string to check
+    
+    Returns:
+        True if the string is a valid ISO datetime
+    """
     try:
-        datetime.fromisoformat(event["date"].replace('Z', '+00:00'))
-    except (ValueError, TypeError):
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
         return False
-    
     return True
 
 
@@ -3,10 +3,65 @@ Logging utilities for the Sports Calendar App.
 Provides centralized logging configuration and utilities.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from pathlib import Path
-from typing import Optional
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Dict, Optional
+
+# One background listener per log file; loggers only enqueue records
+_log_queues: Dict[str, queue.Queue] = {}
+_listeners_lock = threading.Lock()
+
+
+def _get_log_queue(log_file: str) -> queue.Queue:
+    """
+    Get the record queue feeding the console and file handlers for a log file.
+    
+    The first call for a log file starts a QueueListener thread that does
+    the actual writes, so logging calls never block on I/O. Console output
+    is written immediately; file output is buffered.
+    
+    Args:
+        log_file: Log file path
+    
+    Returns:
+        Queue to attach a QueueHandler to
+    """
+    with _listeners_lock:
+        log_queue = _log_queues.get(log_file)
+        if log_queue is not None:
+            return log_queue
+        
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        
+        # Batch file writes; errors and a full buffer force a flush
+        buffered_file_handler = MemoryHandler(
+            1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, console_handler, buffered_file_handler)
+        listener.start()
+        # atexit runs in reverse order: drain the queue, then flush the buffer
+        atexit.register(buffered_file_handler.flush)
+        atexit.register(listener.stop)
+        
+        _log_queues[log_file] = log_queue
+        return log_queue
 
 
 def get_logger(name: str, log_file: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
@@ -29,35 +84,30 @@ def get_logger(name: str, log_file: Optional[str] = None, level: int = logging.I
     
     logger.setLevel(level)
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
     if log_file is None:
         log_file = 'sports_calendar.log'
     
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Records are written to the console and file by a background listener
+    logger.addHandler(QueueHandler(_get_log_queue(log_file)))
     
     return logger
 
 
+# One logger per class, shared by all of its instances
+_class_loggers = {}
+
+
 class LoggerMixin:
     """Mixin class to add logging capabilities to any class."""
     
+    # No per-instance state, so slotted subclasses stay dict-free
+    __slots__ = ()
+    
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class."""
-        if not hasattr(self, '_logger'):
-            self._logger = get_logger(self.__class__.__module__ + '.' + self.__class__.__name__)
-        return self._logger
+        cls = type(self)
+        try:
+            return _class_loggers[cls]
+        except KeyError:
+            return _class_loggers.setdefault(cls, get_logger(f"{cls.__module__}.{cls.__name__}"))
@@ -2,112 +2,190 @@
 Monitoring and metrics collection utilities.
 """
 
+import threading
 import time
-from datetime import datetime, timedelta
+import prometheus_client
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 from .logger import LoggerMixin
 
+# Per-metric sample cap and how long samples are kept for summaries
+MAX_METRIC_SAMPLES = 10000
+METRIC_RETENTION_HOURS = 24
+
+# Expired samples are dropped in batches so trimming stays amortized O(1)
+_TRIM_BATCH = 1024
+
+# Process-wide Prometheus series, served at /metrics
+COUNTERS = prometheus_client.Counter(
+    "gw_counter_total", "Application counters by name", ["name"]
+)
+OPERATION_DURATION = prometheus_client.Histogram(
+    "gw_operation_duration_seconds", "Duration of timed operations", ["name"]
+)
+FETCH_ERRORS = prometheus_client.Counter(
+    "gw_fetch_errors_total", "Data fetch errors", ["sport", "error_type"]
+)
+
 
 class MetricsCollector(LoggerMixin):
     """Collects and tracks metrics for the application."""
     
+    __slots__ = ('_timestamps', '_values', 'counters', 'timers', 'histograms', '_lock')
+    
     def __init__(self):
-        self.metrics = defaultdict(list)
+        # Parallel float arrays per metric: epoch seconds (sorted) and values
+        self._timestamps = defaultdict(lambda: array('d'))
+        self._values = defaultdict(lambda: array('d'))
         self.counters = defaultdict(int)
         self.timers = {}
+        # Power-of-two duration buckets per timer: bucket n counts
+        # durations of [2**(n-1), 2**n) microseconds
+        self.histograms = defaultdict(Counter)
+        self._lock = threading.Lock()
     
     def record_metric(self, name: str, value: float, timestamp: Optional[datetime] = None):
         """Record a metric value."""
-        if timestamp is None:
-            timestamp = datetime.now()
+        ts = time.time() if timestamp is None else timestamp.timestamp()
+        cutoff = ts - METRIC_RETENTION_HOURS * 3600
         
-        self.metrics[name].append({
-            'value': value,
-            'timestamp': timestamp
-        })
+        with self._lock:
+            timestamps = self._timestamps[name]
+            values = self._values[name]
+            if not timestamps or ts >= timestamps[-1]:
+                timestamps.append(ts)
+                values.append(value)
+            else:
+                index = bisect_right(timestamps, ts)
+                timestamps.insert(index, ts)
+                values.insert(index, value)
+            
+            if len(timestamps) >= _TRIM_BATCH and (
+                    len(timestamps) > MAX_METRIC_SAMPLES + _TRIM_BATCH or
+                    timestamps[_TRIM_BATCH - 1] < cutoff):
+                drop = max(bisect_left(timestamps, cutoff), len(timestamps) - MAX_METRIC_SAMPLES)
+                del timestamps[:drop]
+                del values[:drop]
     
     def increment_counter(self, name: str, amount: int = 1):
         """Increment a counter metric."""
-        self.counters[name] += amount
+        with self._lock:
+            self.counters[name] += amount
+        COUNTERS.labels(name).inc(amount)
     
     def start_timer(self, name: str):
         """Start timing an operation."""
-        self.timers[name] = time.time()
+        self.timers[name] = time.monotonic_ns()
     
     def end_timer(self, name: str) -> float:
         """End timing an operation and record the duration."""
-        if name not in self.timers:
+        start_ns = self.timers.pop(name, None)
+        if start_ns is None:
             self.logger.warning(f"Timer '{name}' was not started")
             return 0.0
         
-        duration = time.time() - self.timers[name]
-        del self.timers[name]
+        elapsed_us = (time.monotonic_ns() - start_ns) // 1000
+        with self._lock:
+            self.histograms[name][elapsed_us.bit_length()] += 1
         
+        duration = elapsed_us / 1_000_000
+        OPERATION_DURATION.labels(name).observe(duration)
         self.record_metric(f"{name}_duration", duration)
         return duration
     
     def get_metric_summary(self, name: str, hours: int = 24) -> Dict[str, Any]:
         """Get summary statistics for a metric."""
-        cutoff = datetime.now() - timedelta(hours=hours)
-        recent_values = [
-            m['value'] for m in self.metrics[name] 
-            if m['timestamp'] >= cutoff
-        ]
+        cutoff = time.time() - hours * 3600
+        with self._lock:
+            timestamps = self._timestamps.get(name)
+            if not timestamps:
+                return {'count': 0}
+            start = max(bisect_left(timestamps, cutoff), len(timestamps) - MAX_METRIC_SAMPLES)
+            values = self._values[name][start:]
         
-        if not recent_values:
+        if not values:
             return {'count': 0}
         
+        # One pass for all statistics instead of separate sum/min/max walks
+        total = 0.0
+        low = high = values[0]
+        for value in values:
+            total += value
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+        
+        count = len(values)
         return {
-            'count': len(recent_values),
-            'sum': sum(recent_values),
-            'avg': sum(recent_values) / len(recent_values),
-            'min': min(recent_values),
-            'max': max(recent_values)
+            'count': count,
+            'sum': total,
+            'avg': total / count,
+            'min': low,
+            'max': high
         }
     
     def get_all_metrics(self) -> Dict[str, Any]:
         """Get all current metrics."""
-        return {
-            'metrics': dict(self.metrics),
-            'counters': dict(self.counters),
-            'active_timers': list(self.timers.keys())
-        }
+        # Snapshot under the lock so concurrent records can't resize the
+        # arrays or dicts mid-iteration
+        with self._lock:
+            return {
+                'metrics': {
+                    name: [
+                        {'value': value, 'timestamp': datetime.fromtimestamp(ts)}
+                        for ts, value in zip(timestamps, self._values[name])
+                    ]
+                    for name, timestamps in self._timestamps.items()
+                },
+                'counters': dict(self.counters),
+                'histograms': {name: dict(buckets) for name, buckets in self.histograms.items()},
+                'active_timers': list(self.timers.keys())
+            }
 
 
 class HealthMonitor(LoggerMixin):
     """Monitors application health and performance."""
     
+    __slots__ = ('metrics', 'last_successful_fetch', 'error_counts', '_lock')
+    
     def __init__(self):
         self.metrics = MetricsCollector()
+        # Epoch seconds of the last successful fetch per sport
         self.last_successful_fetch = {}
-        self.error_counts = defaultdict(int)
+        self.error_counts = Counter()
+        self._lock = threading.Lock()
     
     def record_successful_fetch(self, sport: str):
         """Record a successful data fetch for a sport."""
-        self.last_successful_fetch[sport] = datetime.now()
+        self.last_successful_fetch[sport] = time.time()
         self.metrics.increment_counter(f"{sport}_successful_fetches")
         self.logger.debug(f"Recorded successful fetch for {sport}")
     
     def record_fetch_error(self, sport: str, error_type: str):
         """Record a fetch error for a sport."""
         error_key = f"{sport}_{error_type}"
-        self.error_counts[error_key] += 1
+        with self._lock:
+            self.error_counts[error_key] += 1
+        FETCH_ERRORS.labels(sport, error_type).inc()
         self.metrics.increment_counter(f"{sport}_fetch_errors")
         self.logger.warning(f"Recorded fetch error for {sport}: {error_type}")
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get overall health status of the application."""
-        now = datetime.now()
+        now = time.time()
         status = {
-            'timestamp': now.isoformat(),
+            'timestamp': datetime.fromtimestamp(now).isoformat(),
             'overall_status': 'healthy',
             'sports_status': {}
         }
         
         # Check each sport's health
         for sport, last_fetch in self.last_successful_fetch.items():
-            hours_since_fetch = (now - last_fetch).total_seconds() / 3600
+            hours_since_fetch = (now - last_fetch) / 3600.0
             
             if hours_since_fetch > 48:  # More than 2 days
                 sport_status = 'unhealthy'
@@ -121,7 +199,7 @@ class HealthMonitor(LoggerMixin):
             
             status['sports_status'][sport] = {
                 'status': sport_status,
-                'last_successful_fetch': last_fetch.isoformat(),
+                'last_successful_fetch': datetime.fromtimestamp(last_fetch).isoformat(),
                 'hours_since_fetch': round(hours_since_fetch, 2)
             }
         
@@ -3,14 +3,384 @@ Webhook delivery utilities.
 Handles sending events to configured webhook endpoints.
 """
 
-import json
+import gzip
+import ipaddress
+import orjson
+import os
+import queue
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on webhooks delivered to at the same time
+MAX_DELIVERY_WORKERS = 8
+
+# Delivery attempts per webhook, including the first one
+WEBHOOK_ATTEMPTS = 3
+
+# Gzip bodies at least this large; 0 disables compression since not every
+# receiver decodes a gzip Content-Encoding
+WEBHOOK_GZIP_MIN_BYTES = int(os.getenv('WEBHOOK_GZIP_MIN_BYTES', '0'))
+
+# Pending (delivery, events) items for the background delivery worker
+WEBHOOK_QUEUE_SIZE = 1024
+WEBHOOK_DRAIN_LIMIT = 128
+
+# Queued batches arriving within this many seconds of each other are sent
+# as one POST, up to WEBHOOK_MAX_BATCH_EVENTS events
+WEBHOOK_BATCH_WINDOW = 0.2
+WEBHOOK_MAX_BATCH_EVENTS = 500
+
+_session = None
+_session_lock = threading.Lock()
+
+# Seconds a DNS-based host verdict is trusted before resolving again
+HOST_CHECK_TTL = 300.0
+_HOST_VERDICT_LIMIT = 256
+
+_host_verdicts: Dict[str, Tuple[float, bool]] = {}
+_host_verdicts_lock = threading.Lock()
+
+_delivery_queue = queue.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for webhook delivery.
+    
+    A single session keeps connections to webhook hosts alive between
+    deliveries, so repeat posts skip the TCP and TLS handshakes. Every new
+    connection is checked against the address it actually reached, see
+    _PublicOnlyAdapter.
+    
+    Returns:
+        Session with pooled, retrying adapters mounted
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=WEBHOOK_ATTEMPTS - 1,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=["POST"],
+                    raise_on_status=False
+                )
+                adapter = _PublicOnlyAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _is_internal_ip(ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> bool:
+    """
+    Check whether an address is loopback, private, link-local or otherwise non-public.
+    
+    Args:
+        ip: Parsed IPv4 or IPv6 address
+    
+    Returns:
+        True if the address must not be used as a webhook target
+    """
+    if ip.version == 6 and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return (ip.is_private or ip.is_loopback or ip.is_link_local or
+            ip.is_reserved or ip.is_multicast or ip.is_unspecified)
+
+
+class _PublicPeerMixin:
+    """
+    Refuse a freshly opened socket whose peer address is internal.
+    
+    _validate_url vets a host name with its own DNS lookup, and urllib3
+    resolves the name again when it connects. A host that rebinds between
+    the two lookups would otherwise reach an internal address, so the
+    connected peer is checked before any request bytes (or TLS handshake)
+    go out.
+    """
+    
+    def _new_conn(self):
+        sock = super()._new_conn()
+        peer = sock.getpeername()[0]
+        if _is_internal_ip(ipaddress.ip_address(peer.split('%', 1)[0])):
+            sock.close()
+            raise NewConnectionError(self, f"Refusing webhook connection to internal address {peer}")
+        return sock
+
+
+class _PublicHTTPConnection(_PublicPeerMixin, HTTPConnection):
+    pass
+
+
+class _PublicHTTPSConnection(_PublicPeerMixin, HTTPSConnection):
+    pass
+
+
+class _PublicHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _PublicHTTPConnection
+
+
+class _PublicHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _PublicHTTPSConnection
+
+
+class _PublicOnlyAdapter(HTTPAdapter):
+    """HTTP adapter whose direct connections may only reach public addresses."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _PublicHTTPConnectionPool,
+            "https": _PublicHTTPSConnectionPool,
+        }
+
+
+def _resolves_to_public(hostname: str) -> bool:
+    """
+    Resolve a host name and check that none of its addresses are internal.
+    
+    Args:
+        hostname: Lower-cased host name
+    
+    Returns:
+        True if the host has addresses and all of them are public
+    
+    Raises:
+        socket.gaierror: If the lookup fails
+    """
+    addresses = {info[4][0] for info in socket.getaddrinfo(hostname, None)}
+    for address in addresses:
+        # Drop any IPv6 zone id before parsing
+        if _is_internal_ip(ipaddress.ip_address(address.split('%', 1)[0])):
+            return False
+    return bool(addresses)
+
+
+def _is_public_host(hostname: str) -> bool:
+    """
+    Check that every address a hostname resolves to is publicly routable.
+    
+    Verdicts from a successful lookup are reused for HOST_CHECK_TTL seconds,
+    so a host that later points somewhere else is re-checked. Failed
+    lookups are not remembered; the next delivery simply tries again.
+    
+    Args:
+        hostname: Lower-cased host name or IP literal
+    
+    Returns:
+        True if the host resolves and none of its addresses are internal
+    """
+    # IP literals are classified directly, without a resolver call
+    try:
+        return not _is_internal_ip(ipaddress.ip_address(hostname))
+    except ValueError:
+        pass
+    
+    now = time.monotonic()
+    hit = _host_verdicts.get(hostname)
+    if hit is not None and now - hit[0] < HOST_CHECK_TTL:
+        return hit[1]
+    
+    try:
+        verdict = _resolves_to_public(hostname)
+    except (socket.gaierror, UnicodeError) as e:
+        logger.warning(f"Could not resolve webhook host {hostname}: {e}")
+        return False
+    
+    with _host_verdicts_lock:
+        if len(_host_verdicts) >= _HOST_VERDICT_LIMIT:
+            _host_verdicts.clear()
+        _host_verdicts[hostname] = (now, verdict)
+    return verdict
+
+
+@lru_cache(maxsize=128)
+def _check_url_syntax(url: str) -> Tuple[bool, Optional[str]]:
+    """
+    Run the checks on a webhook URL that don't depend on DNS.
+    
+    Args:
+        url: URL to validate
+    
+    Returns:
+        Whether the URL may be used, and the host name that still has to be
+        resolved (None for IP literals, which are classified here)
+    """
+    try:
+        parsed = urlparse(url)
+        
+        # Must be HTTP or HTTPS
+        if parsed.scheme not in ['http', 'https']:
+            return False, None
+        
+        # Must have a hostname
+        if not parsed.hostname:
+            return False, None
+        
+        hostname = parsed.hostname.lower()
+    except ValueError as e:
+        logger.error(f"Error validating webhook URL: {e}")
+        return False, None
+    
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        return True, hostname
+    return not _is_internal_ip(ip), None
+
+
+def _validate_url(url: str) -> bool:
+    """
+    Validate webhook URL to prevent SSRF attacks.
+    
+    This is the early, cached check; a host that re-resolves to an internal
+    address after passing it is still refused at connect time by the
+    session's adapter.
+    
+    Args:
+        url: URL to validate
+    
+    Returns:
+        True if URL is safe to use
+    """
+    allowed, hostname = _check_url_syntax(url)
+    
+    # Host names go through the TTL-bounded resolver check every time
+    if allowed and hostname is not None:
+        allowed = _is_public_host(hostname)
+    
+    if not allowed:
+        logger.warning(f"Blocked webhook URL: {url}")
+    return allowed
+
+
+def _collect_batch() -> List[tuple]:
+    """
+    Block for the next queued delivery, then gather more until the queue is
+    idle for WEBHOOK_BATCH_WINDOW seconds or a size cap is reached.
+    
+    Returns:
+        Queued (delivery, events) items in the order they were added
+    """
+    items = [_delivery_queue.get()]
+    event_count = len(items[0][1])
+    while len(items) < WEBHOOK_DRAIN_LIMIT and event_count < WEBHOOK_MAX_BATCH_EVENTS:
+        try:
+            item = _delivery_queue.get(timeout=WEBHOOK_BATCH_WINDOW)
+        except queue.Empty:
+            break
+        items.append(item)
+        event_count += len(item[1])
+    return items
+
+
+def _delivery_worker():
+    """Deliver queued events in the background, coalescing bursts into one POST."""
+    while True:
+        items = _collect_batch()
+        
+        # Merge consecutive items bound for the same database's webhooks
+        start = 0
+        while start < len(items):
+            delivery = items[start][0]
+            target = getattr(delivery.db, 'db_name', None)
+            end = start + 1
+            while end < len(items) and getattr(items[end][0].db, 'db_name', None) == target:
+                end += 1
+            
+            events = [event for _, batch in items[start:end] for event in batch]
+            try:
+                result = delivery.send_new_events(events)
+                logger.info(f"Webhook delivery result: {result}")
+            except Exception as e:
+                logger.error(f"Failed to send webhooks: {e}")
+            finally:
+                for _ in range(start, end):
+                    _delivery_queue.task_done()
+            start = end
+
+
+def _ensure_worker():
+    """Start the background delivery worker if it is not running yet."""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_delivery_worker, name="webhook-delivery", daemon=True)
+                _worker.start()
+
+
+def flush_webhook_queue(timeout: Optional[float] = None) -> bool:
+    """
+    Wait for every queued webhook delivery to be attempted.
+    
+    Args:
+        timeout: Seconds to wait at most; None waits indefinitely
+    
+    Returns:
+        True if the queue drained, False if the timeout ran out first
+    """
+    if _worker is None:
+        return True
+    
+    # Queue.join has no timeout, so wait on it from a helper thread
+    joiner = threading.Thread(target=_delivery_queue.join, name="webhook-flush", daemon=True)
+    joiner.start()
+    joiner.join(timeout)
+    return not joiner.is_alive()
+
+
+def close_webhook_session():
+    """Close the shared webhook session and release its pooled sockets."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+@dataclass(slots=True)
+class DeliveryResult:
+    """Outcome of delivering one payload to one webhook."""
+    
+    webhook: str
+    url: str
+    success: bool
+    status_code: Optional[int] = None
+    attempts: int = 0
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the result as a JSON-ready dictionary."""
+        return {
+            "webhook": self.webhook,
+            "url": self.url,
+            "success": self.success,
+            "status_code": self.status_code,
+            "attempts": self.attempts,
+            "error": self.error
+        }
+
 
 class WebhookDelivery:
     """Handles webhook delivery to configured endpoints."""
@@ -19,7 +389,7 @@ class WebhookDelivery:
         """Initialize webhook delivery with database manager."""
         self.db = db_manager
         self.timeout = 10  # seconds
-        self.retry_count = 3
+        self.retry_count = WEBHOOK_ATTEMPTS
     
     def send_new_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -52,125 +422,158 @@ class WebhookDelivery:
             "total": len(events)
         }
         
+        result = self._deliver_to_all(webhook_configs, payload)
+        result["events_sent"] = len(events)
+        return result
+    
+    def queue_new_events(self, events: List[Dict[str, Any]]) -> bool:
+        """
+        Queue new events for delivery by the background worker.
+        
+        Returns straight away, so the caller never waits on slow webhook
+        endpoints. Use send_new_events when the delivery result is needed.
+        
+        Args:
+            events: List of event dictionaries
+        
+        Returns:
+            True if the events were queued, False if the queue is full
+        """
+        if not events:
+            return True
+        
+        _ensure_worker()
+        try:
+            _delivery_queue.put_nowait((self, events))
+        except queue.Full:
+            logger.warning(f"Webhook queue full, dropping {len(events)} events")
+            return False
+        return True
+    
+    def send_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send an arbitrary payload once to every configured webhook.
+        
+        Args:
+            payload: Data to send
+        
+        Returns:
+            Dictionary with delivery status
+        """
+        webhook_configs = []
+        if self.db:
+            webhook_configs = self.db.get_webhook_configs()
+        
+        if not webhook_configs:
+            logger.warning("No webhook endpoints configured")
+            return {"success": False, "error": "No webhook endpoints configured", "webhooks_notified": 0}
+        
+        return self._deliver_to_all(webhook_configs, payload)
+    
+    def _deliver_to_all(self, webhook_configs: List[Dict[str, Any]], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Deliver one payload to each webhook configuration.
+        
+        Args:
+            webhook_configs: Webhook configurations from the database
+            payload: Data to send
+        
+        Returns:
+            Dictionary with delivery status
+        """
         results = []
         successful_deliveries = 0
         
-        for config in webhook_configs:
+        # Encode once; every webhook receives the same bytes
+        body = orjson.dumps(payload)
+        encoding = None
+        if WEBHOOK_GZIP_MIN_BYTES and len(body) >= WEBHOOK_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            encoding = "gzip"
+        
+        # Endpoints are independent, so a slow one no longer holds up the rest
+        workers = min(len(webhook_configs), MAX_DELIVERY_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._deliver_to_webhook, config['url'], body, config['name'], encoding)
+                for config in webhook_configs
+            ]
+        
+        for config, future in zip(webhook_configs, futures):
             webhook_url = config['url']
             webhook_name = config['name']
             
             try:
-                result = self._deliver_to_webhook(webhook_url, payload, webhook_name)
-                results.append(result)
-                if result['success']:
-                    successful_deliveries += 1
+                result = future.result()
             except Exception as e:
                 logger.error(f"Failed to deliver to webhook {webhook_name}: {e}")
-                results.append({
-                    "webhook": webhook_name,
-                    "url": webhook_url,
-                    "success": False,
-                    "error": str(e)
-                })
+                result = DeliveryResult(webhook_name, webhook_url, False, error=str(e))
+            
+            if result.success:
+                successful_deliveries += 1
+            results.append(result.to_dict())
         
         return {
             "success": successful_deliveries > 0,
-            "events_sent": len(events),
             "webhooks_notified": successful_deliveries,
             "total_webhooks": len(webhook_configs),
             "results": results
         }
     
-    def _deliver_to_webhook(self, url: str, payload: Dict[str, Any], name: str = "webhook") -> Dict[str, Any]:
+    def _deliver_to_webhook(self, url: str, body: bytes, name: str = "webhook",
+                            encoding: Optional[str] = None) -> DeliveryResult:
         """
-        Deliver payload to a specific webhook URL.
+        Deliver an encoded payload to a specific webhook URL.
         
         Args:
             url: Webhook URL
-            payload: Data to send
+            body: JSON-encoded payload to send
             name: Webhook name for logging
+            encoding: Content-Encoding applied to the body, if any
         
         Returns:
-            Dictionary with delivery result
+            Delivery result
         """
         # Validate URL to prevent SSRF
         if not self._is_safe_webhook_url(url):
-            return {
-                "webhook": name,
-                "url": url,
-                "success": False,
-                "error": "Invalid or unsafe webhook URL",
-                "attempts": 0
-            }
+            return DeliveryResult(name, url, False, error="Invalid or unsafe webhook URL")
         
         headers = {
             "Content-Type": "application/json",
             "User-Agent": "game-watcher/1.0"
         }
+        if encoding:
+            headers["Content-Encoding"] = encoding
         
-        for attempt in range(self.retry_count):
-            try:
-                logger.info(f"Delivering to webhook {name} (attempt {attempt + 1}/{self.retry_count})")
-                
-                response = requests.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-                
-                if response.status_code in [200, 201, 202, 204]:
-                    logger.info(f"Successfully delivered to webhook {name}")
-                    return {
-                        "webhook": name,
-                        "url": url,
-                        "success": True,
-                        "status_code": response.status_code,
-                        "attempt": attempt + 1
-                    }
-                else:
-                    logger.warning(f"Webhook {name} returned status {response.status_code}")
-                    if attempt < self.retry_count - 1:
-                        continue
-                    return {
-                        "webhook": name,
-                        "url": url,
-                        "success": False,
-                        "status_code": response.status_code,
-                        "error": f"HTTP {response.status_code}",
-                        "attempts": attempt + 1
-                    }
-                    
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout delivering to webhook {name} (attempt {attempt + 1})")
-                if attempt < self.retry_count - 1:
-                    continue
-                return {
-                    "webhook": name,
-                    "url": url,
-                    "success": False,
-                    "error": "Timeout",
-                    "attempts": attempt + 1
-                }
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request error delivering to webhook {name}: {e}")
-                if attempt < self.retry_count - 1:
-                    continue
-                return {
-                    "webhook": name,
-                    "url": url,
-                    "success": False,
-                    "error": str(e),
-                    "attempts": attempt + 1
-                }
+        # Retries and backoff are handled by the session's urllib3 adapter
+        try:
+            logger.info(f"Delivering to webhook {name}")
+            
+            response = _get_session().post(
+                url,
+                data=body,
+                headers=headers,
+                timeout=self.timeout
+            )
+        except requests.exceptions.Timeout:
+            logger.warning(f"Timeout delivering to webhook {name}")
+            return DeliveryResult(name, url, False, attempts=self.retry_count, error="Timeout")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error delivering to webhook {name}: {e}")
+            return DeliveryResult(name, url, False, attempts=self.retry_count, error=str(e))
         
-        return {
-            "webhook": name,
-            "url": url,
-            "success": False,
-            "error": "Max retries exceeded",
-            "attempts": self.retry_count
-        }
+        retries = getattr(response.raw, 'retries', None)
+        attempts = len(retries.history) + 1 if retries is not None else 1
+        
+        if response.status_code in [200, 201, 202, 204]:
+            logger.info(f"Successfully delivered to webhook {name}")
+            return DeliveryResult(name, url, True, response.status_code, attempts)
+        
+        logger.warning(f"Webhook {name} returned status {response.status_code}")
+        return DeliveryResult(
+            name, url, False, response.status_code, attempts,
+            error=f"HTTP {response.status_code}"
+        )
     
     def test_webhook(self, url: str) -> bool:
         """
@@ -194,9 +597,9 @@ class WebhookDelivery:
         }
         
         try:
-            response = requests.post(
+            response = _get_session().post(
                 url,
-                json=test_payload,
+                data=orjson.dumps(test_payload),
                 headers={"Content-Type": "application/json"},
                 timeout=self.timeout
             )
@@ -215,51 +618,11 @@ class WebhookDelivery:
         Returns:
             True if URL is safe to use
         """
-        from urllib.parse import urlparse
-        
-        try:
-            parsed = urlparse(url)
-            
-            # Must be HTTP or HTTPS
-            if parsed.scheme not in ['http', 'https']:
-                return False
-            
-            # Must have a hostname
-            if not parsed.hostname:
-                return False
-            
-            # Block localhost and private IP ranges
-            hostname = parsed.hostname.lower()
-            
-            # Block localhost variants
-            if hostname in ['localhost', '127.0.0.1', '0.0.0.0', '::1']:
-                logger.warning(f"Blocked localhost webhook URL: {url}")
-                return False
-            
-            # Block private IP ranges (simplified check)
-            if (hostname.startswith('10.') or 
-                hostname.startswith('192.168.') or
-                hostname.startswith('172.16.') or
-                hostname.startswith('172.17.') or
-                hostname.startswith('172.18.') or
-                hostname.startswith('172.19.') or
-                hostname.startswith('172.20.') or
-                hostname.startswith('172.21.') or
-                hostname.startswith('172.22.') or
-                hostname.startswith('172.23.') or
-                hostname.startswith('172.24.') or
-                hostname.startswith('172.25.') or
-                hostname.startswith('172.26.') or
-                hostname.startswith('172.27.') or
-                hostname.startswith('172.28.') or
-                hostname.startswith('172.29.') or
-                hostname.startswith('172.30.') or
-                hostname.startswith('172.31.')):
-                logger.warning(f"Blocked private IP webhook URL: {url}")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error validating webhook URL: {e}")
-            return False
+        return _validate_url(url)
+    
+    @staticmethod
+    def clear_url_cache():
+        """Forget cached URL and host checks, e.g. after webhook configs change."""
+        _check_url_syntax.cache_clear()
+        with _host_verdicts_lock:
+            _host_verdicts.clear()
@@ -3,16 +3,23 @@
 FastAPI web server for Sports Calendar application.
 """
 
+import os
 import uvicorn
 from api import create_app
 
 app = create_app()
 
 if __name__ == "__main__":
+    # Each worker runs its own betting odds scheduler, so keep one worker
+    # unless the odds API quota allows more
     uvicorn.run(
         "web_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=os.getenv('WEB_RELOAD', '').lower() in ('1', 'true', 'yes'),
+        workers=int(os.getenv('WEB_WORKERS', '1')),
+        # "auto" picks uvloop and httptools whenever they are installed
+        loop=os.getenv('WEB_LOOP', 'auto'),
+        http=os.getenv('WEB_HTTP', 'auto'),
         log_level="info"
     )